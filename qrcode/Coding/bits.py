@@ -0,0 +1,78 @@
+"""
+This module contains a bit buffer used to assemble the encoded data stream.
+"""
+
+
+class BitBuffer:
+    def __init__(self) -> None:
+        """Growable sequence of bits packed into a bytearray.
+
+        Bits are stored most significant bit first, the unused low bits of
+        the last byte are always zero.
+        """
+        self.data = bytearray()
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def append(self, value: int, length: int) -> None:
+        """Adding the lowest `length` bits of a number.
+
+        Args:
+            value: The number to be written.
+            length: Number of bits.
+        """
+        value &= (1 << length) - 1
+        self.length += length
+
+        free = -(self.length - length) % 8
+        if free:
+            take = min(free, length)
+            length -= take
+            self.data[-1] |= (value >> length) << (free - take)
+
+        while length >= 8:
+            length -= 8
+            self.data.append((value >> length) & 0xFF)
+
+        if length:
+            self.data.append((value << (8 - length)) & 0xFF)
+
+    def extend(self, other: "BitBuffer") -> None:
+        """Adding all bits of another buffer.
+
+        Args:
+            other: Bit buffer.
+        """
+        self._extend(other.data, other.length)
+
+    def extend_bytes(self, data: bytes) -> None:
+        """Adding whole bytes.
+
+        Args:
+            data: Bytes to be written.
+        """
+        self._extend(data, len(data) * 8)
+
+    def _extend(self, data: bytes, length: int) -> None:
+        used = self.length % 8
+
+        if not used:
+            self.data += data
+        elif data:
+            count = len(data)
+            head = self.data.pop() >> (8 - used)
+            value = (head << (8 * count)) | int.from_bytes(data, 'big')
+            self.data += (value << (8 - used)).to_bytes(count + 1, 'big')
+
+        self.length += length
+        del self.data[(self.length + 7) // 8:]
+
+    def to_bytes(self) -> bytes:
+        """Packed buffer contents.
+
+        Returns:
+            Buffer bytes, the last byte is padded with zero bits.
+        """
+        return bytes(self.data)
@@ -1,25 +1,337 @@
+from functools import reduce
+from operator import xor
+from typing import Optional, Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 import qrcode.Coding.methods as mt
+from qrcode.Coding import reed_solomon, segments
+from qrcode.Coding.bits import BitBuffer
+from qrcode.Constants import const, spec, capacity
+from qrcode.Matrix import symbol
+
+
+def _charset(data: mt.Data, encoding_type: int, charset: Optional[str]) -> Optional[str]:
+    # only byte coding has a character set
+    if encoding_type not in (const.TYPE_BYTE, const.TYPE_AUTO):
+        return None
+
+    return mt.charset_name(data, charset)
+
+
+def data_stream(
+        string: mt.Data,
+        encoding_type: int,
+        correction_level: int,
+        charset: Optional[str] = None,
+        prefix: Optional[BitBuffer] = None
+) -> tuple[int, BitBuffer]:
+    """Encoding a string and adding service information.
+
+    Args:
+        string: The string to be encoded (binary data for byte coding).
+        encoding_type: Coding type, const.TYPE_AUTO splits the string into
+        segments of different types (binary data is byte coded).
+        correction_level: Correction level.
+        charset: Character set of byte coding (see methods.charset_name).
+        Defaults to None (UTF-8 without ECI).
+        prefix: Segments added before the data. Defaults to None.
+
+    Returns:
+        Version, encoded data with service information.
+    """
+    if encoding_type == const.TYPE_AUTO and not isinstance(string, str):
+        encoding_type = const.TYPE_BYTE
+
+    charset = _charset(string, encoding_type, charset)
+
+    if encoding_type == const.TYPE_AUTO:
+        return segments.service_fields(string, correction_level, charset, prefix)
+
+    buffer = mt.data_encoding(string, encoding_type, charset)
+    return mt.service_fields(buffer, encoding_type, correction_level, len(string), charset, prefix)
+
+
+def fit_version(
+        data: mt.Data,
+        encoding_type: int,
+        correction_level: int,
+        charset: Optional[str] = None,
+        prefix: Optional[BitBuffer] = None
+) -> Optional[int]:
+    """The version of the data without encoding it (the characters are
+    not checked).
+
+    Args:
+        data: The string to encode (binary data for byte coding).
+        encoding_type: Encoding type. (TYPE_BYTE, TYPE_ALPHA, TYPE_DIGIT, TYPE_KANJI or TYPE_AUTO)
+        correction_level: Correction level. (LEVEL_L, LEVEL_M, LEVEL_Q or LEVEL_H)
+        charset: Character set of byte coding (see methods.charset_name).
+        Defaults to None (UTF-8 without ECI).
+        prefix: Segments added before the data. Defaults to None.
+
+    Returns:
+        Version of qrcode, None if the data does not fit into version 40.
+    """
+    if encoding_type == const.TYPE_AUTO and not isinstance(data, str):
+        encoding_type = const.TYPE_BYTE
+
+    charset = _charset(data, encoding_type, charset)
+
+    if encoding_type == const.TYPE_AUTO:
+        result = segments.fit(data, correction_level, charset, prefix)
+        return None if result is None else result[0]
+
+    if encoding_type == const.TYPE_BYTE:
+        amount = len(mt.byte_data(data, charset))
+    else:
+        amount = len(data)
+
+    bits_length = len(mt.eci_designator(charset)) + capacity.payload_bits(encoding_type, amount)
+    if prefix is not None:
+        bits_length += len(prefix)
+
+    return capacity.select_version(encoding_type, correction_level, bits_length)
+
+
+def estimate_version(
+        data: mt.Data,
+        encoding_type: int,
+        correction_level: int,
+        charset: Optional[str] = None
+) -> int:
+    """The version of the data without encoding it (the characters are
+    not checked).
+
+    Args:
+        data: The string to encode (binary data for byte coding).
+        encoding_type: Encoding type. (TYPE_BYTE, TYPE_ALPHA, TYPE_DIGIT, TYPE_KANJI or TYPE_AUTO)
+        correction_level: Correction level. (LEVEL_L, LEVEL_M, LEVEL_Q or LEVEL_H)
+        charset: Character set of byte coding (see methods.charset_name).
+        Defaults to None (UTF-8 without ECI).
+
+    Returns:
+        Version of qrcode.
+    """
+    version = fit_version(data, encoding_type, correction_level, charset)
+
+    if version is None:
+        raise Exception("Error! Too much encoded data!")
+
+    return version
 
 
 def encode(
-        string_to_encode: str,
+        string_to_encode: mt.Data,
         encoding_type: int,
-        correction_level: int
+        correction_level: int,
+        charset: Optional[str] = None
 ) -> tuple[list[int], int]:
     """A function for encoding data with a specified correction level and encoding type.
 
     Args:
-        string_to_encode: The string to encode.
-        encoding_type: Encoding type. (TYPE_BYTE, TYPE_ALPHA or TYPE_DIGIT)
+        string_to_encode: The string to encode (binary data for byte coding).
+        encoding_type: Encoding type. (TYPE_BYTE, TYPE_ALPHA, TYPE_DIGIT, TYPE_KANJI or TYPE_AUTO)
         correction_level: Correction level. (LEVEL_L, LEVEL_M, LEVEL_Q or LEVEL_H)
+        charset: Character set of byte coding: a codec name, "auto" or None
+        (UTF-8 without ECI, the default).
 
     Returns:
         Combined block and version of qrcode.
     """
-    string = mt.data_encoding(string_to_encode, encoding_type)
-    version, string = mt.service_fields(string, encoding_type, correction_level, len(string_to_encode))
-    blocks = mt.division_into_blocks(string, version, correction_level)
+    version, buffer = data_stream(string_to_encode, encoding_type, correction_level, charset)
+    blocks = mt.division_into_blocks(buffer, version, correction_level)
     corr_blocks = mt.creating_correction_bytes(blocks, version, correction_level)
-    combined_block = mt.combining_blocks(blocks, corr_blocks)
+    combined_block = mt.combining_blocks(blocks, corr_blocks, version, correction_level)
 
     return combined_block, version
+
+
+def encode_batch(
+        strings_to_encode: Sequence[mt.Data],
+        encoding_type: int,
+        correction_level: int,
+        backend: int = None,
+        charset: Optional[str] = None
+) -> list[tuple[list[int], int]]:
+    """Encoding many strings. With NumPy the strings are grouped by version
+    and the correction bytes of each group are computed at once.
+
+    Args:
+        strings_to_encode: The strings to encode.
+        encoding_type: Encoding type. (TYPE_BYTE, TYPE_ALPHA, TYPE_DIGIT, TYPE_KANJI or TYPE_AUTO)
+        correction_level: Correction level. (LEVEL_L, LEVEL_M, LEVEL_Q or LEVEL_H)
+        backend: const.BACKEND_PYTHON or const.BACKEND_NUMPY. Defaults to
+        NumPy when it is installed.
+        charset: Character set of byte coding: a codec name, "auto" or None
+        (UTF-8 without ECI, the default).
+
+    Returns:
+        Combined block and version of every string, in the same order.
+    """
+    streams = [
+        data_stream(string, encoding_type, correction_level, charset)
+        for string in strings_to_encode
+    ]
+
+    return combine_streams(streams, correction_level, backend)
+
+
+def encode_structured(
+        data: mt.Data,
+        encoding_type: int,
+        correction_level: int,
+        charset: Optional[str] = None,
+        max_version: int = 40,
+        backend: int = None
+) -> list[tuple[list[int], int]]:
+    """Structured Append: splitting the data into up to 16 symbols with a
+    sequence header (symbol number, number of symbols and parity of the
+    data). Data that fits into one symbol is encoded as usual.
+
+    Args:
+        data: The string to encode (binary data for byte coding).
+        encoding_type: Encoding type. (TYPE_BYTE, TYPE_ALPHA, TYPE_DIGIT, TYPE_KANJI or TYPE_AUTO)
+        correction_level: Correction level. (LEVEL_L, LEVEL_M, LEVEL_Q or LEVEL_H)
+        charset: Character set of byte coding: a codec name, "auto" or None
+        (UTF-8 without ECI, the default).
+        max_version: The largest version of the symbols. Defaults to 40.
+        backend: const.BACKEND_PYTHON or const.BACKEND_NUMPY. Defaults to
+        NumPy when it is installed.
+
+    Returns:
+        Combined block and version of every symbol, in the order of the
+        sequence.
+    """
+    if not 1 <= max_version <= 40:
+        raise Exception("Error! Incorrect version entered.")
+
+    if not isinstance(data, str):
+        data = mt.byte_data(data)
+        if encoding_type == const.TYPE_AUTO:
+            encoding_type = const.TYPE_BYTE
+
+    # the same character set for all the symbols
+    charset = _charset(data, encoding_type, charset)
+
+    version = fit_version(data, encoding_type, correction_level, charset)
+    if version is not None and version <= max_version:
+        return [encode(data, encoding_type, correction_level, charset)]
+
+    if encoding_type == const.TYPE_KANJI:
+        parity = reduce(xor, data.encode('shift_jis'), 0)
+    else:
+        parity = reduce(xor, mt.byte_data(data, charset), 0)
+
+    for total in range(2, 17):
+        size, num_of_add = divmod(len(data), total)
+        bounds = [pos * size + min(pos, num_of_add) for pos in range(total + 1)]
+
+        parts = [
+            (data[bounds[pos]:bounds[pos + 1]], mt.structured_append(pos, total, parity))
+            for pos in range(total)
+        ]
+
+        versions = [
+            fit_version(part, encoding_type, correction_level, charset, header)
+            for part, header in parts
+        ]
+
+        if all(version is not None and version <= max_version for version in versions):
+            streams = [
+                data_stream(part, encoding_type, correction_level, charset, header)
+                for part, header in parts
+            ]
+            return combine_streams(streams, correction_level, backend)
+
+    raise Exception("Error! Too much encoded data!")
+
+
+def combine_streams(
+        streams: Sequence[tuple[int, BitBuffer]],
+        correction_level: int,
+        backend: int = None
+) -> list[tuple[list[int], int]]:
+    """Adding correction bytes to encoded data. With NumPy the data is
+    grouped by version and the correction bytes of each group are computed
+    at once.
+
+    Args:
+        streams: Version and encoded data with service information of
+        every string.
+        correction_level: Correction level.
+        backend: const.BACKEND_PYTHON or const.BACKEND_NUMPY. Defaults to
+        NumPy when it is installed.
+
+    Returns:
+        Combined block and version of every string, in the same order.
+    """
+    backend = symbol.get_backend(backend)
+
+    if backend != const.BACKEND_NUMPY:
+        result = []
+
+        for version, buffer in streams:
+            blocks = mt.division_into_blocks(buffer, version, correction_level)
+            corr_blocks = mt.creating_correction_bytes(blocks, version, correction_level)
+            result.append((mt.combining_blocks(blocks, corr_blocks, version, correction_level), version))
+
+        return result
+
+    groups = {}
+    for index, (version, buffer) in enumerate(streams):
+        groups.setdefault((version, correction_level), []).append((index, buffer.to_bytes()))
+
+    result = [None] * len(streams)
+
+    for (version, level), items in groups.items():
+        data = numpy.frombuffer(b''.join(data for _, data in items), dtype=numpy.uint8)
+        data = data.reshape(len(items), -1)
+
+        for (index, _), combined_block in zip(items, combine_array(data, version, level).tolist()):
+            result[index] = (combined_block, version)
+
+    return result
+
+
+def combine_array(
+        data: "numpy.ndarray",
+        version: int,
+        correction_level: int
+) -> "numpy.ndarray":
+    """Adding correction bytes to many encoded strings of the same version
+    and correction level (NumPy backend).
+
+    Args:
+        data: (count, data codewords) uint8 array, encoded strings with
+        added service information.
+        version: Version QR-code.
+        correction_level: Correction level.
+
+    Returns:
+        (count, codewords) uint8 array of combined blocks.
+    """
+    symbol_spec = spec.get(version, correction_level)
+    count = data.shape[0]
+    degree = symbol_spec.ec_codewords
+
+    # blocks of the same length are encoded together
+    short = symbol_spec.block_sizes[0]
+    num_short = symbol_spec.block_sizes.count(short)
+    num_long = len(symbol_spec.block_sizes) - num_short
+
+    parts = [(data[:, :short * num_short].reshape(count * num_short, short), num_short)]
+    if num_long:
+        parts.append((data[:, short * num_short:].reshape(count * num_long, short + 1), num_long))
+
+    parity = [
+        reed_solomon.remainder_array(blocks, degree).reshape(count, num * degree)
+        for blocks, num in parts
+    ]
+
+    codewords = numpy.concatenate([data] + parity, axis=1)
+
+    return codewords[:, symbol_spec.interleave]
@@ -4,40 +4,48 @@ This module contains functions that are needed to encode data (strings).
 import sys
 
 import re
+import codecs
+from typing import Optional, Union
 
-from qrcode.Constants import tables, const
+from qrcode.Constants import tables, const, spec, capacity
+from qrcode.Coding import reed_solomon
+from qrcode.Coding.bits import BitBuffer
 
 
-def digital_coding(string: str) -> str:
+# string or binary data (byte coding only)
+Data = Union[str, bytes, bytearray, memoryview]
+
+
+def digital_coding(string: str) -> BitBuffer:
     """Digital coding. This type of encoding requires 10 bits per 3 characters.
 
     Args:
         string: String consisting of numbers.
 
     Returns:
-        Encoded binary string.
+        Encoded bit buffer.
     """
     if re.match(r"^\d+$", string) is None:
         print("Error! For digital coding, only numbers are allowed!")
         sys.exit()
 
-    binary_string = ""
+    buffer = BitBuffer()
 
     for pos in range(0, len(string), 3):
         number = string[pos:pos+3]
 
         value = int(number)
         if len(number) == 3:
-            binary_string += bin(value)[2::].zfill(10)
+            buffer.append(value, 10)
         elif len(number) == 2:
-            binary_string += bin(value)[2::].zfill(7)
+            buffer.append(value, 7)
         else:
-            binary_string += bin(value)[2::].zfill(4)
+            buffer.append(value, 4)
 
-    return binary_string
+    return buffer
 
 
-def alphanumeric_coding(string: str) -> str:
+def alphanumeric_coding(string: str) -> BitBuffer:
     """Alphanumeric coding. This method requires 11 bits of information
     per 2 characters.
 
@@ -45,7 +53,7 @@ def alphanumeric_coding(string: str) -> str:
         string: A string consisting of numbers, Latin characters and some others.
 
     Returns:
-        Encoded binary string.
+        Encoded bit buffer.
     """
     alphanum_table = tables.alphanumeric_table()
 
@@ -55,7 +63,7 @@ def alphanumeric_coding(string: str) -> str:
         print(*alphanum_table.keys())
         sys.exit()
 
-    binary_string = ""
+    buffer = BitBuffer()
 
     for pos in range(0, len(string), 2):
         word = string[pos:pos + 2]
@@ -63,214 +71,331 @@ def alphanumeric_coding(string: str) -> str:
         if len(word) == 2:
             num_one, num_two = [alphanum_table.get(char) for char in word]
             number = num_one * 45 + num_two
-            binary_string += bin(number)[2::].zfill(11)
+            buffer.append(number, 11)
         else:
             number = alphanum_table.get(word)
-            binary_string += bin(number)[2::].zfill(6)
+            buffer.append(number, 6)
+
+    return buffer
+
+
+# character sets tried by charset="auto", the first of the most compact
+# ones is chosen unless UTF-8 (no ECI segment) is as compact
+AUTO_CHARSETS = (
+    'iso8859-1', 'cp1252', 'iso8859-2', 'cp1250', 'iso8859-5', 'cp1251',
+    'iso8859-7', 'shift_jis'
+)
+
+
+def charset_name(data: Data, charset: Optional[str]) -> Optional[str]:
+    """Choosing the character set of byte coding.
+
+    Args:
+        data: A string or binary data.
+        charset: Codec name, "auto" (the most compact of AUTO_CHARSETS for
+        strings, none for binary data and strings that are no longer in
+        UTF-8) or None (UTF-8 without ECI).
+
+    Returns:
+        Codec name (see tables.eci_table) or None.
+    """
+    if charset is None:
+        return None
+
+    if charset == "auto":
+        if not isinstance(data, str):
+            return None
+
+        best = (None, len(data.encode('utf-8')))
+        for name in AUTO_CHARSETS:
+            try:
+                length = len(data.encode(name))
+            except UnicodeEncodeError:
+                continue
+
+            if length < best[1]:
+                best = (name, length)
+
+        return best[0]
+
+    try:
+        name = codecs.lookup(charset).name
+    except LookupError:
+        name = None
+
+    if name not in tables.eci_table():
+        raise Exception("Error! Unsupported charset entered.")
+
+    return name
+
+
+def eci_designator(charset: Optional[str]) -> BitBuffer:
+    """ECI segment of a character set.
+
+    Args:
+        charset: Codec name (see charset_name), None for no segment.
+
+    Returns:
+        Encoded bit buffer.
+    """
+    buffer = BitBuffer()
+
+    if charset is not None:
+        number = tables.eci_table().get(charset)
+        buffer.append(0b0111, 4)
+
+        if number < 1 << 7:
+            buffer.append(number, 8)
+        elif number < 1 << 14:
+            buffer.append(0b10 << 14 | number, 16)
+        else:
+            buffer.append(0b110 << 21 | number, 24)
+
+    return buffer
+
+
+def structured_append(index: int, total: int, parity: int) -> BitBuffer:
+    """Structured Append header.
+
+    Args:
+        index: Number of the symbol (from 0).
+        total: Number of symbols (up to 16).
+        parity: XOR of all bytes of the data.
+
+    Returns:
+        Encoded bit buffer.
+    """
+    buffer = BitBuffer()
+    buffer.append(0b0011, 4)
+    buffer.append(index, 4)
+    buffer.append(total - 1, 4)
+    buffer.append(parity, 8)
+
+    return buffer
+
+
+def byte_data(data: Data, charset: Optional[str] = None) -> Union[bytes, memoryview]:
+    """Bytes of the data for byte encoding: strings are encoded in the
+    character set, binary data is used as is (without copying, unless it is
+    a non-contiguous memoryview).
+
+    Args:
+        data: A string or binary data.
+        charset: Codec name. Defaults to UTF-8.
+
+    Returns:
+        Bytes.
+    """
+    if isinstance(data, str):
+        try:
+            return data.encode(charset or 'utf-8')
+        except UnicodeEncodeError:
+            raise Exception(f"Error! The string can not be encoded in {charset}.")
+
+    view = memoryview(data)
+
+    if not view.c_contiguous:
+        # a strided view can not be cast, its bytes are copied
+        return bytes(view)
+
+    return view.cast('B')
+
+
+def byte_coding(string: Data, charset: Optional[str] = None) -> BitBuffer:
+    """Byte encoding. The data is encoded in UTF-8 encoding or in the
+    given character set.
+
+    Args:
+        string: A string consisting of any characters or binary data
+        (bytes, bytearray or memoryview).
+        charset: Codec name. Defaults to UTF-8.
+
+    Returns:
+        Encoded bit buffer.
+    """
+    buffer = BitBuffer()
+    buffer.extend_bytes(byte_data(string, charset))
+
+    return buffer
+
+
+def kanji_value(char: str) -> Optional[int]:
+    """Number of a character in Kanji coding (Shift JIS).
+
+    Args:
+        char: Character.
 
-    return binary_string
+    Returns:
+        13-bit number, None if the character is not a double-byte Shift JIS
+        character of the Kanji mode ranges (0x8140-0x9FFC, 0xE040-0xEBBF).
+    """
+    try:
+        code = char.encode('shift_jis')
+    except UnicodeEncodeError:
+        return None
+
+    if len(code) != 2:
+        return None
+
+    value = int.from_bytes(code, 'big')
 
+    if 0x8140 <= value <= 0x9FFC:
+        value -= 0x8140
+    elif 0xE040 <= value <= 0xEBBF:
+        value -= 0xC140
+    else:
+        return None
+
+    return (value >> 8) * 0xC0 + (value & 0xFF)
 
-def byte_coding(string: str) -> str:
-    """Byte encoding. The data is encoded in UTF-8 encoding.
+
+def kanji_coding(string: str) -> BitBuffer:
+    """Kanji coding. This method requires 13 bits per character
+    (double-byte Shift JIS characters).
 
     Args:
-        string: A string consisting of any characters.
+        string: A string consisting of Kanji characters.
 
     Returns:
-        Encoded binary string.
+        Encoded bit buffer.
     """
-    byte_list = []
-    for byte in bytearray(string, 'utf-8'):
-        byte = bin(byte)[2::].zfill(8)
-        byte_list.append(byte)
+    buffer = BitBuffer()
+
+    for char in string:
+        value = kanji_value(char)
 
-    return ''.join(byte_list)
+        if value is None:
+            raise Exception("Error! For Kanji coding, only double-byte Shift JIS "
+                            "characters are allowed!")
 
+        buffer.append(value, 13)
 
-def data_encoding(string: str, encoding_type: int) -> str:
+    return buffer
+
+
+def data_encoding(
+    string: Data,
+    encoding_type: int,
+    charset: Optional[str] = None
+) -> BitBuffer:
     """A function that calls a specific encoding method.
 
     Args:
-        string: The string to be encoded.
+        string: The string to be encoded (binary data for byte coding).
         encoding_type: Coding type.
+        charset: Codec name of byte coding. Defaults to UTF-8.
 
     Returns:
-        Encoded binary string.
+        Encoded bit buffer.
     """
+    if not isinstance(string, str) and encoding_type != const.TYPE_BYTE:
+        raise Exception("Error! Binary data can only be encoded with byte coding!")
+
     if encoding_type == const.TYPE_DIGIT:
         return digital_coding(string)
 
     elif encoding_type == const.TYPE_BYTE:
-        return byte_coding(string)
+        return byte_coding(string, charset)
 
     elif encoding_type == const.TYPE_ALPHA:
         return alphanumeric_coding(string)
 
+    elif encoding_type == const.TYPE_KANJI:
+        return kanji_coding(string)
+
     else:
         raise Exception("Error! Invalid encoding type entered!")
 
 
 def service_fields(
-    string: str,
+    buffer: BitBuffer,
     encoding_type: int,
     correction_level: int,
-    symbol_amount: int
-) -> tuple[int, str]:
+    symbol_amount: int,
+    charset: Optional[str] = None,
+    prefix: Optional[BitBuffer] = None
+) -> tuple[int, BitBuffer]:
     """Determining the version, maximum block length and adding service information.
 
     Args:
-        string: Encoded string.
+        buffer: Encoded data.
         encoding_type: Coding type.
         correction_level: Correction level.
         symbol_amount: The number of characters in the original string.
+        charset: Codec name (see charset_name), an ECI segment is added
+        before the data. Defaults to None.
+        prefix: Segments added before the data (and the ECI segment).
+        Defaults to None.
 
     Returns:
-        Version, encoded string with service information.
+        Version, encoded data with service information.
     """
-    if correction_level == const.LEVEL_L:
-        bits_table = tables.bits_table_l()
-
-    elif correction_level == const.LEVEL_M:
-        bits_table = tables.bits_table_m()
+    result = BitBuffer()
+    if prefix is not None:
+        result.extend(prefix)
+    result.extend(eci_designator(charset))
 
-    elif correction_level == const.LEVEL_Q:
-        bits_table = tables.bits_table_q()
+    version = capacity.select_version(encoding_type, correction_level, len(result) + len(buffer))
 
-    elif correction_level == const.LEVEL_H:
-        bits_table = tables.bits_table_h()
-
-    else:
-        raise Exception("Error! Incorrect correction level entered.")
-
-    for i, bits in enumerate(bits_table.values()):
-        if bits > len(string):
-            version = i + 1
-            bits_amount = bits
-            break
-    else:
+    if version is None:
         print("Error! Too much encoded data!")
         sys.exit()
 
-    while True:
-        service_string = ""
-
-        if 1 <= version <= 9:
-            if encoding_type == const.TYPE_DIGIT:
-                number = symbol_amount
-                service_string += "0001" + bin(number)[2::].zfill(10)
-
-            elif encoding_type == const.TYPE_ALPHA:
-                number = symbol_amount
-                service_string += "0010" + bin(number)[2::].zfill(9)
+    if encoding_type == const.TYPE_BYTE:
+        symbol_amount = len(buffer) // 8
 
-            elif encoding_type == const.TYPE_BYTE:
-                number = len(string) // 8
-                service_string += "0100" + bin(number)[2::].zfill(8)
+    result.append(capacity.MODE_INDICATORS[encoding_type], 4)
+    result.append(symbol_amount, capacity.count_bits(encoding_type, version))
 
-        elif 10 <= version <= 26:
-            if encoding_type == const.TYPE_DIGIT:
-                number = symbol_amount
-                service_string += "0001" + bin(number)[2::].zfill(12)
+    result.extend(buffer)
+    padding(result, spec.get(version, correction_level).data_bits)
 
-            elif encoding_type == const.TYPE_ALPHA:
-                number = symbol_amount
-                service_string += "0010" + bin(number)[2::].zfill(11)
+    return version, result
 
-            elif encoding_type == const.TYPE_BYTE:
-                number = len(string) // 8
-                service_string += "0100" + bin(number)[2::].zfill(16)
 
-        elif 27 <= version <= 40:
-            if encoding_type == const.TYPE_DIGIT:
-                number = symbol_amount
-                service_string += "0001" + bin(number)[2::].zfill(14)
-
-            elif encoding_type == const.TYPE_ALPHA:
-                number = symbol_amount
-                service_string += "0010" + bin(number)[2::].zfill(13)
-
-            elif encoding_type == const.TYPE_BYTE:
-                number = len(string) // 8
-                service_string += "0100" + bin(number)[2::].zfill(16)
-
-        else:
-            raise Exception("Error! Too much encoded data!")
+def padding(buffer: BitBuffer, bits_amount: int, terminator: int = 4) -> None:
+    """Adding the terminator, zero bits up to a whole byte and the filler
+    bytes.
 
-        if len(string) + len(service_string) <= bits_amount:
-            break
-        else:
-            version += 1
-            bits_amount = bits_table.get(version)
-
-    string = service_string + string
-
-    delta = bits_amount - len(string)
-    if delta >= 4:
-        string += '0000'
-    else:
-        string += '0' * delta
+    Args:
+        buffer: Encoded data with service information.
+        bits_amount: Maximum amount of data of the version (bits).
+        terminator: Length of the terminator. Defaults to 4 (QR code).
+    """
+    delta = bits_amount - len(buffer)
+    buffer.append(0, min(delta, terminator))
 
-    delta = bits_amount - len(string)
+    delta = bits_amount - len(buffer)
     num_byte, zero_bits = divmod(delta, 8)
 
-    string += '0' * zero_bits
-
-    for i in range(num_byte):
-        string += '00010001' * (i % 2)
-        string += '11101100' * ((i + 1) % 2)
-
-    return version, string
+    buffer.append(0, zero_bits)
+    buffer.extend_bytes(b'\xec\x11' * (num_byte // 2) + b'\xec' * (num_byte % 2))
 
 
 def division_into_blocks(
-    string: str,
+    buffer: BitBuffer,
     version: int,
     correction_level: int
 ) -> list[list[int]]:
-    """Splitting the encoded string into blocks.
+    """Splitting the encoded data into blocks.
 
     Args:
-        string: Encoded string with added service information.
+        buffer: Encoded data with added service information.
         version: Version QR-code.
         correction_level: Correction level.
 
     Returns:
         List consisting of lists - blocks of information.
     """
-    if correction_level == const.LEVEL_L:
-        num_of_blocks = tables.blocks_table_l().get(version)
-
-    elif correction_level == const.LEVEL_M:
-        num_of_blocks = tables.blocks_table_m().get(version)
-
-    elif correction_level == const.LEVEL_Q:
-        num_of_blocks = tables.blocks_table_q().get(version)
-
-    elif correction_level == const.LEVEL_H:
-        num_of_blocks = tables.blocks_table_h().get(version)
-
-    else:
-        raise Exception("Error! Incorrect correction level entered.")
-
-    byte_amount = len(string) // 8
-    block_size, num_of_add = divmod(byte_amount, num_of_blocks)
-
-    pos = (num_of_blocks-num_of_add) * block_size*8
+    block_sizes = spec.get(version, correction_level).block_sizes
+    data = buffer.to_bytes()
 
     blocks = []
+    pos = 0
 
-    for i in range(0, pos, block_size*8):
-        block = []
-        for k in range(i, i + block_size*8, 8):
-            block.append(int(string[k:k + 8], 2))
-        blocks.append(block)
-
-    for i in range(pos, len(string), (block_size+1)*8):
-        block = []
-        for k in range(i, i + (block_size+1)*8, 8):
-            block.append(int(string[k:k + 8], 2))
-        blocks.append(block)
+    for block_size in block_sizes:
+        blocks.append(list(data[pos:pos + block_size]))
+        pos += block_size
 
     return blocks
 
@@ -290,51 +415,16 @@ def creating_correction_bytes(
     Returns:
         List containing lists - correction blocks.
     """
-    if correction_level == const.LEVEL_L:
-        num_corr_byte = tables.correction_byte_table_l().get(version)
-
-    elif correction_level == const.LEVEL_M:
-        num_corr_byte = tables.correction_byte_table_m().get(version)
-
-    elif correction_level == const.LEVEL_Q:
-        num_corr_byte = tables.correction_byte_table_q().get(version)
-
-    elif correction_level == const.LEVEL_H:
-        num_corr_byte = tables.correction_byte_table_h().get(version)
-
-    else:
-        raise Exception("Error! Incorrect correction level entered.")
-
-    gf_dict = tables.gf_table()
-    gf_dict_rev = tables.gf_reversed_table()
-
-    polynomial = tables.generating_polynomials_table().get(num_corr_byte)
+    num_corr_byte = spec.get(version, correction_level).ec_codewords
 
-    corr_blocks = []
-
-    for block in blocks:
-        array = block.copy() + [0]*abs(num_corr_byte - len(block))
-
-        for _ in range(len(block)):
-            a = array.pop(0)
-            array.append(0)
-
-            if a == 0:
-                continue
-
-            b = gf_dict_rev.get(a)
-            for i, coff in enumerate(polynomial):
-                c = (coff + b) % 255
-                array[i] ^= gf_dict.get(c)
-
-        corr_blocks.append(array)
-
-    return corr_blocks
+    return [list(reed_solomon.remainder(bytes(block), num_corr_byte)) for block in blocks]
 
 
 def combining_blocks(
     blocks: list[list[int]],
     correction_blocks: list[list[int]],
+    version: int,
+    correction_level: int
 ) -> list[int]:
     """Function for combining data blocks and correction blocks.
 
@@ -343,26 +433,13 @@ def combining_blocks(
         information.
         correction_blocks: List containing lists -
         correction blocks.
+        version: Version QR-code.
+        correction_level: Correction level.
 
     Returns:
         A combined block that contains data from data blocks and correction blocks.
     """
-    combined_block = []
-    len_blocks = max([len(block) for block in blocks])
-    len_corr_blocks = max([len(block) for block in correction_blocks])
-
-    for i in range(len_blocks):
-        for block in blocks:
-            try:
-                combined_block.append(block[i])
-            except IndexError:
-                pass
-
-    for i in range(len_corr_blocks):
-        for block in correction_blocks:
-            try:
-                combined_block.append(block[i])
-            except IndexError:
-                pass
+    codewords = [byte for block in blocks for byte in block]
+    codewords += [byte for block in correction_blocks for byte in block]
 
-    return combined_block
+    return [codewords[i] for i in spec.get(version, correction_level).interleave]
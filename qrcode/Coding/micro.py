@@ -0,0 +1,185 @@
+"""
+This module contains the encoding of Micro QR codes (versions M1-M4):
+shorter mode indicators and count fields, a terminator of the version
+length, one block of correction bytes and a 4-bit last data codeword in M1
+and M3. Micro QR codes have no ECI segments, so only the default character
+set is supported.
+"""
+from typing import Optional
+
+import qrcode.Coding.methods as mt
+from qrcode.Coding import reed_solomon, segments
+from qrcode.Coding.bits import BitBuffer
+from qrcode.Constants import const, microTables
+
+
+def count_bits(encoding_type: int, version: int) -> Optional[int]:
+    """Length of the character count field.
+
+    Args:
+        encoding_type: Coding type.
+        version: Micro QR code version (1-4 for M1-M4).
+
+    Returns:
+        Number of bits, None if the coding is not available in the version.
+    """
+    return microTables.count_bits_table()[encoding_type][version - 1]
+
+
+def headers(version: int) -> dict[int, int]:
+    """Length of the mode indicator and the count field of every coding
+    type available in the version.
+
+    Args:
+        version: Micro QR code version.
+
+    Returns:
+        Dictionary of the form {coding type: number of bits}.
+    """
+    indicator = microTables.mode_indicator_table()[version]
+
+    return {
+        mode: indicator + count_bits(mode, version)
+        for mode in segments.GROUPS
+        if count_bits(mode, version) is not None
+    }
+
+
+def encode_segments(segments_list: list[tuple[int, mt.Data]], version: int) -> BitBuffer:
+    """Encoding segments with their mode indicators and character counts.
+
+    Args:
+        segments_list: List of (coding type, substring) tuples.
+        version: Micro QR code version.
+
+    Returns:
+        Encoded bit buffer.
+    """
+    indicator = microTables.mode_indicator_table()[version]
+    buffer = BitBuffer()
+
+    for encoding_type, string in segments_list:
+        data = mt.data_encoding(string, encoding_type)
+
+        if encoding_type == const.TYPE_BYTE:
+            count = len(data) // 8
+        else:
+            count = len(string)
+
+        buffer.append(microTables.mode_table()[encoding_type], indicator)
+        buffer.append(count, count_bits(encoding_type, version))
+        buffer.extend(data)
+
+    return buffer
+
+
+def padding(buffer: BitBuffer, version: int, bits_amount: int) -> None:
+    """Adding the terminator, zero bits up to a whole codeword and the
+    filler bytes, the 4-bit last codeword of M1 and M3 is filled with zeros.
+
+    Args:
+        buffer: Encoded data with service information.
+        version: Micro QR code version.
+        bits_amount: Maximum amount of data (bits).
+    """
+    delta = bits_amount - len(buffer)
+    buffer.append(0, min(delta, microTables.terminator_table()[version]))
+
+    delta = bits_amount - len(buffer)
+    buffer.append(0, min(delta, -len(buffer) % 8))
+
+    num_byte, zero_bits = divmod(bits_amount - len(buffer), 8)
+    buffer.extend_bytes(b'\xec\x11' * (num_byte // 2) + b'\xec' * (num_byte % 2))
+    buffer.append(0, zero_bits)
+
+
+def data_stream(
+        string: mt.Data,
+        encoding_type: int,
+        correction_level: int,
+        charset: Optional[str] = None
+) -> Optional[tuple[int, BitBuffer]]:
+    """Choosing the smallest Micro QR code version that fits the data and
+    adding service information.
+
+    Args:
+        string: The string to be encoded (binary data for byte coding).
+        encoding_type: Coding type, const.TYPE_AUTO splits the string into
+        segments of the types available in the version.
+        correction_level: Correction level.
+        charset: Character set of byte coding, Micro QR codes support only
+        the default one (None).
+
+    Returns:
+        Version (1-4 for M1-M4), encoded data with service information,
+        None if the data does not fit into a Micro QR code.
+    """
+    if charset is not None:
+        return None
+
+    if encoding_type == const.TYPE_AUTO and not isinstance(string, str):
+        encoding_type = const.TYPE_BYTE
+
+    bits_table = microTables.bits_table()
+
+    for version in microTables.size_table():
+        bits_amount = bits_table.get((version, correction_level))
+        if bits_amount is None:
+            continue
+
+        available = headers(version)
+
+        if encoding_type == const.TYPE_AUTO:
+            if any(
+                all(segments.char_bits(mode, 0, char) is None for mode in available)
+                for char in string
+            ):
+                continue
+
+            segments_list = segments.segment(string, version, headers=available)
+
+        elif encoding_type in available:
+            segments_list = [(encoding_type, string)]
+
+        else:
+            continue
+
+        buffer = encode_segments(segments_list, version)
+
+        if len(buffer) <= bits_amount:
+            padding(buffer, version, bits_amount)
+            return version, buffer
+
+    return None
+
+
+def encode(
+        string_to_encode: mt.Data,
+        encoding_type: int,
+        correction_level: int,
+        charset: Optional[str] = None
+) -> Optional[tuple[list[int], int]]:
+    """Encoding data into a Micro QR code.
+
+    Args:
+        string_to_encode: The string to encode (binary data for byte coding).
+        encoding_type: Encoding type. (TYPE_BYTE, TYPE_ALPHA, TYPE_DIGIT, TYPE_KANJI or TYPE_AUTO)
+        correction_level: Correction level. (LEVEL_L, LEVEL_M or LEVEL_Q)
+        charset: Character set of byte coding, Micro QR codes support only
+        the default one (None).
+
+    Returns:
+        Data bytes followed by the correction bytes (the last data byte of
+        M1 and M3 holds 4 bits) and version of Micro QR code, None if the
+        data does not fit into a Micro QR code.
+    """
+    result = data_stream(string_to_encode, encoding_type, correction_level, charset)
+
+    if result is None:
+        return None
+
+    version, buffer = result
+    data = buffer.to_bytes()
+    degree = microTables.correction_byte_table()[(version, correction_level)]
+
+    return list(data + reed_solomon.remainder(data, degree)), version
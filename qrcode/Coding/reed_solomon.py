@@ -0,0 +1,139 @@
+"""
+This module contains Galois field GF(256) arithmetic and the Reed-Solomon
+encoder used to create the correction bytes.
+"""
+from functools import lru_cache
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from qrcode.Constants import tables
+
+
+@lru_cache(maxsize=None)
+def gf_tables() -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Galois field tables.
+
+    Returns:
+        Tuple of the form (powers of two, logarithms). Powers are repeated
+        up to 2 * 255 so that the sum of two logarithms needs no modulo,
+        the logarithm of 0 is 0.
+    """
+    gf_dict = tables.gf_table()
+    gf_dict_rev = tables.gf_reversed_table()
+
+    exp = tuple(gf_dict.get(num % 255) for num in range(510))
+    log = tuple(gf_dict_rev.get(num, 0) for num in range(256))
+
+    return exp, log
+
+
+def multiply(a: int, b: int) -> int:
+    """Multiplication in GF(256).
+
+    Args:
+        a: First factor.
+        b: Second factor.
+
+    Returns:
+        Product.
+    """
+    if a == 0 or b == 0:
+        return 0
+
+    gf_exp, gf_log = gf_tables()
+    return gf_exp[gf_log[a] + gf_log[b]]
+
+
+@lru_cache(maxsize=None)
+def generator(degree: int) -> bytes:
+    """Generating polynomial.
+
+    Args:
+        degree: Number of correction bytes.
+
+    Returns:
+        Coefficients from the highest power, without the leading 1.
+    """
+    gf_exp, _ = gf_tables()
+
+    return bytes(gf_exp[power] for power in tables.generating_polynomials_table().get(degree))
+
+
+@lru_cache(maxsize=None)
+def feedback_table(degree: int) -> tuple[int, ...]:
+    """Products of the generating polynomial and every byte, packed into
+    numbers (the highest coefficient in the most significant byte).
+
+    Args:
+        degree: Number of correction bytes.
+
+    Returns:
+        Packed products indexed by the byte.
+    """
+    polynomial = generator(degree)
+
+    return tuple(
+        int.from_bytes(bytes(multiply(factor, coff) for coff in polynomial), 'big')
+        for factor in range(256)
+    )
+
+
+def remainder(data: bytes, degree: int) -> bytes:
+    """Correction bytes of a block: the remainder of the division of the
+    block by the generating polynomial, computed as a shift register.
+
+    Args:
+        data: Data block.
+        degree: Number of correction bytes.
+
+    Returns:
+        Correction bytes.
+    """
+    table = feedback_table(degree)
+    shift = 8 * (degree - 1)
+    mask = (1 << shift) - 1
+
+    register = 0
+    for byte in data:
+        register = ((register & mask) << 8) ^ table[(register >> shift) ^ byte]
+
+    return register.to_bytes(degree, 'big')
+
+
+@lru_cache(maxsize=None)
+def feedback_array(degree: int) -> "numpy.ndarray":
+    """Products of the generating polynomial and every byte (NumPy backend).
+
+    Args:
+        degree: Number of correction bytes.
+
+    Returns:
+        (256, degree) uint8 array indexed by the byte, the highest
+        coefficient first.
+    """
+    table = b''.join(value.to_bytes(degree, 'big') for value in feedback_table(degree))
+
+    return numpy.frombuffer(table, dtype=numpy.uint8).reshape(256, degree)
+
+
+def remainder_array(blocks: "numpy.ndarray", degree: int) -> "numpy.ndarray":
+    """Correction bytes of many blocks of the same length at once
+    (NumPy backend).
+
+    Args:
+        blocks: (count, length) uint8 array of data blocks.
+        degree: Number of correction bytes.
+
+    Returns:
+        (count, degree) uint8 array of correction bytes.
+    """
+    table = feedback_array(degree)
+    register = numpy.zeros((blocks.shape[0], degree + 1), dtype=numpy.uint8)
+
+    for column in blocks.T:
+        register[:, :-1] = register[:, 1:] ^ table[register[:, 0] ^ column]
+
+    return register[:, :-1].copy()
@@ -0,0 +1,191 @@
+"""
+This module contains the encoding of rectangular Micro QR codes (rMQR):
+3-bit mode indicators and terminator, count fields of the version length
+and the correction levels M and H. Only the default character set is
+supported.
+"""
+from typing import Optional
+
+import qrcode.Coding.methods as mt
+from qrcode.Coding import reed_solomon, segments
+from qrcode.Coding.bits import BitBuffer
+from qrcode.Constants import const, spec, rmqrTables
+
+
+def _level_tables(correction_level: int) -> tuple[dict, dict, dict]:
+    if correction_level == const.LEVEL_M:
+        return (rmqrTables.bits_table_m(), rmqrTables.blocks_table_m(),
+                rmqrTables.correction_byte_table_m())
+
+    elif correction_level == const.LEVEL_H:
+        return (rmqrTables.bits_table_h(), rmqrTables.blocks_table_h(),
+                rmqrTables.correction_byte_table_h())
+
+    else:
+        raise Exception("Error! Incorrect correction level entered.")
+
+
+def count_bits(encoding_type: int, version: int) -> int:
+    """Length of the character count field.
+
+    Args:
+        encoding_type: Coding type.
+        version: rMQR code version (1-32).
+
+    Returns:
+        Number of bits.
+    """
+    return rmqrTables.count_bits_table()[encoding_type][version - 1]
+
+
+def headers(version: int) -> dict[int, int]:
+    """Length of the mode indicator and the count field of every coding type.
+
+    Args:
+        version: rMQR code version.
+
+    Returns:
+        Dictionary of the form {coding type: number of bits}.
+    """
+    return {mode: 3 + count_bits(mode, version) for mode in segments.GROUPS}
+
+
+def versions(height: Optional[int] = None) -> list[int]:
+    """Versions in the order they are tried: from the smallest area, the
+    lower one first.
+
+    Args:
+        height: The largest height (modules). Defaults to None (any).
+
+    Returns:
+        List of versions.
+    """
+    sizes = rmqrTables.size_table()
+
+    return sorted(
+        (version for version, (rows, _) in sizes.items() if height is None or rows <= height),
+        key=lambda version: (sizes[version][0] * sizes[version][1], sizes[version][0])
+    )
+
+
+def encode_segments(segments_list: list[tuple[int, mt.Data]], version: int) -> BitBuffer:
+    """Encoding segments with their mode indicators and character counts.
+
+    Args:
+        segments_list: List of (coding type, substring) tuples.
+        version: rMQR code version.
+
+    Returns:
+        Encoded bit buffer.
+    """
+    buffer = BitBuffer()
+
+    for encoding_type, string in segments_list:
+        data = mt.data_encoding(string, encoding_type)
+
+        if encoding_type == const.TYPE_BYTE:
+            count = len(data) // 8
+        else:
+            count = len(string)
+
+        buffer.append(rmqrTables.mode_table()[encoding_type], 3)
+        buffer.append(count, count_bits(encoding_type, version))
+        buffer.extend(data)
+
+    return buffer
+
+
+def data_stream(
+        string: mt.Data,
+        encoding_type: int,
+        correction_level: int,
+        height: Optional[int] = None
+) -> Optional[tuple[int, BitBuffer]]:
+    """Choosing the smallest rMQR code version that fits the data and
+    adding service information.
+
+    Args:
+        string: The string to be encoded (binary data for byte coding).
+        encoding_type: Coding type, const.TYPE_AUTO splits the string into
+        segments of different types (binary data is byte coded).
+        correction_level: Correction level (LEVEL_M or LEVEL_H).
+        height: The largest height of the code (modules). Defaults to None.
+
+    Returns:
+        Version, encoded data with service information, None if the data
+        does not fit into an rMQR code.
+    """
+    if encoding_type == const.TYPE_AUTO and not isinstance(string, str):
+        encoding_type = const.TYPE_BYTE
+
+    bits_table = _level_tables(correction_level)[0]
+
+    for version in versions(height):
+        bits_amount = bits_table[version]
+
+        if encoding_type == const.TYPE_AUTO:
+            segments_list = segments.segment(string, version, headers=headers(version))
+        else:
+            segments_list = [(encoding_type, string)]
+
+        buffer = encode_segments(segments_list, version)
+
+        if len(buffer) <= bits_amount:
+            mt.padding(buffer, bits_amount, 3)
+            return version, buffer
+
+    return None
+
+
+def encode(
+        string_to_encode: mt.Data,
+        encoding_type: int,
+        correction_level: int,
+        charset: Optional[str] = None,
+        height: Optional[int] = None
+) -> tuple[list[int], int]:
+    """Encoding data into an rMQR code.
+
+    Args:
+        string_to_encode: The string to encode (binary data for byte coding).
+        encoding_type: Encoding type. (TYPE_BYTE, TYPE_ALPHA, TYPE_DIGIT, TYPE_KANJI or TYPE_AUTO)
+        correction_level: Correction level. (LEVEL_M or LEVEL_H)
+        charset: Character set of byte coding, only the default one (None)
+        is supported.
+        height: The largest height of the code (7-17 modules). Defaults to
+        None (any).
+
+    Returns:
+        Combined block of the data and correction bytes and version of rMQR
+        code.
+    """
+    if charset is not None:
+        raise Exception("Error! rMQR codes support only the default charset.")
+
+    result = data_stream(string_to_encode, encoding_type, correction_level, height)
+
+    if result is None:
+        raise Exception("Error! Too much encoded data!")
+
+    version, buffer = result
+    _, blocks_table, correction_table = _level_tables(correction_level)
+
+    data = buffer.to_bytes()
+    num_of_blocks = blocks_table[version]
+    ec_codewords = correction_table[version]
+
+    block_size, num_of_add = divmod(len(data), num_of_blocks)
+    block_sizes = ((block_size,) * (num_of_blocks - num_of_add)
+                   + (block_size + 1,) * num_of_add)
+
+    blocks = []
+    pos = 0
+    for size in block_sizes:
+        blocks.append(data[pos:pos + size])
+        pos += size
+
+    codewords = b''.join(blocks) + b''.join(
+        reed_solomon.remainder(block, ec_codewords) for block in blocks
+    )
+
+    return [codewords[i] for i in spec.interleave_order(block_sizes, ec_codewords)], version
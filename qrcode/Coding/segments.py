@@ -0,0 +1,253 @@
+"""
+This module contains the automatic encoding: the string is split into
+segments of digital, alphanumeric, byte and Kanji coding with the minimum
+total number of bits.
+"""
+from bisect import bisect_left
+from typing import Optional
+
+import qrcode.Coding.methods as mt
+from qrcode.Constants import tables, const, spec, capacity
+from qrcode.Coding.bits import BitBuffer
+
+
+# number of characters encoded together
+GROUPS = {
+    const.TYPE_DIGIT: 3,
+    const.TYPE_ALPHA: 2,
+    const.TYPE_BYTE: 1,
+    const.TYPE_KANJI: 1
+}
+
+ALPHANUMERIC = frozenset(tables.alphanumeric_table())
+
+
+def char_bits(
+    encoding_type: int,
+    phase: int,
+    char: str,
+    charset: Optional[str] = None
+) -> Optional[int]:
+    """Number of bits added by a character.
+
+    Args:
+        encoding_type: Coding type.
+        phase: Number of characters of the segment before this one, modulo
+        the group size.
+        char: Character.
+        charset: Codec name of byte coding. Defaults to UTF-8.
+
+    Returns:
+        Number of bits, None if the character can not be encoded.
+    """
+    if encoding_type == const.TYPE_DIGIT:
+        if '0' <= char <= '9':
+            return 3 if phase else 4
+
+    elif encoding_type == const.TYPE_ALPHA:
+        if char in ALPHANUMERIC:
+            return 5 if phase else 6
+
+    elif encoding_type == const.TYPE_BYTE:
+        try:
+            return 8 * len(char.encode(charset or 'utf-8'))
+        except UnicodeEncodeError:
+            pass
+
+    elif encoding_type == const.TYPE_KANJI:
+        if mt.kanji_value(char) is not None:
+            return 13
+
+    return None
+
+
+def segment(
+    string: str,
+    version: int,
+    charset: Optional[str] = None,
+    headers: Optional[dict[int, int]] = None
+) -> list[tuple[int, str]]:
+    """Splitting a string into segments with the minimum total number of
+    bits (dynamic programming over the characters).
+
+    Args:
+        string: The string to be encoded.
+        version: Version QR-code (the length of the count fields depends
+        on it).
+        charset: Codec name of byte coding. Defaults to UTF-8.
+        headers: Length of the mode indicator and the count field of every
+        available coding type. Defaults to the QR code ones of the version.
+
+    Returns:
+        List of (coding type, substring) tuples.
+    """
+    # state: coding type and number of characters of the segment modulo
+    # the group size
+    if headers is None:
+        headers = {mode: 4 + capacity.count_bits(mode, version) for mode in GROUPS}
+
+    # readers decode Kanji segments in the character set of the ECI segment
+    modes = [
+        mode for mode in headers
+        if mode != const.TYPE_KANJI or charset in (None, 'shift_jis')
+    ]
+
+    states = [(mode, phase) for mode in modes for phase in range(GROUPS[mode])]
+    index = {state: num for num, state in enumerate(states)}
+
+    costs = None
+    steps = []
+
+    for char in string:
+        if costs is None:
+            best, best_num = 0, None
+        else:
+            best = min(cost for cost in costs if cost is not None)
+            best_num = costs.index(best)
+
+        new_costs = [None] * len(states)
+        step = [None] * len(states)
+
+        for num, (mode, phase) in enumerate(states):
+            prev_phase = (phase - 1) % GROUPS[mode]
+            bits = char_bits(mode, prev_phase, char, charset)
+            if bits is None:
+                continue
+
+            # continuing the segment
+            if costs is not None:
+                prev = index[(mode, prev_phase)]
+                if costs[prev] is not None:
+                    new_costs[num] = costs[prev] + bits
+                    step[num] = (prev, False)
+
+            # starting a new segment
+            if prev_phase == 0:
+                cost = best + headers[mode] + bits
+                if new_costs[num] is None or cost < new_costs[num]:
+                    new_costs[num] = cost
+                    step[num] = (best_num, True)
+
+        costs = new_costs
+        steps.append(step)
+
+    if costs is None:
+        return []
+
+    if all(cost is None for cost in costs):
+        raise Exception(f"Error! The string can not be encoded in {charset}.")
+
+    num = costs.index(min(cost for cost in costs if cost is not None))
+
+    # restoring the segments from the end
+    result = []
+    end = len(string)
+    for pos in range(len(string) - 1, -1, -1):
+        prev, is_new = steps[pos][num]
+        if is_new:
+            result.append((states[num][0], string[pos:end]))
+            end = pos
+        num = prev
+
+    return result[::-1]
+
+
+def encode_segments(
+    segments: list[tuple[int, str]],
+    version: int,
+    charset: Optional[str] = None
+) -> BitBuffer:
+    """Encoding segments with their mode indicators and character counts.
+
+    Args:
+        segments: List of (coding type, substring) tuples.
+        version: Version QR-code.
+        charset: Codec name of byte coding (see methods.charset_name), an
+        ECI segment is added if there are byte segments. Defaults to None.
+
+    Returns:
+        Encoded bit buffer.
+    """
+    if any(encoding_type == const.TYPE_BYTE for encoding_type, _ in segments):
+        buffer = mt.eci_designator(charset)
+    else:
+        buffer = BitBuffer()
+
+    for encoding_type, string in segments:
+        data = mt.data_encoding(string, encoding_type, charset)
+
+        if encoding_type == const.TYPE_BYTE:
+            count = len(data) // 8
+        else:
+            count = len(string)
+
+        buffer.append(capacity.MODE_INDICATORS[encoding_type], 4)
+        buffer.append(count, capacity.count_bits(encoding_type, version))
+        buffer.extend(data)
+
+    return buffer
+
+
+def fit(
+    string: str,
+    correction_level: int,
+    charset: Optional[str] = None,
+    prefix: Optional[BitBuffer] = None
+) -> Optional[tuple[int, BitBuffer]]:
+    """Determining the version and splitting the string into segments.
+
+    Args:
+        string: The string to be encoded.
+        correction_level: Correction level.
+        charset: Codec name of byte coding (see methods.charset_name).
+        Defaults to None (UTF-8 without ECI).
+        prefix: Segments added before the data. Defaults to None.
+
+    Returns:
+        Version, encoded data with service information (without padding),
+        None if the data does not fit into version 40.
+    """
+    bits_table = spec.capacities(correction_level)
+
+    for first, last in capacity.VERSION_RANGES:
+        buffer = BitBuffer()
+        if prefix is not None:
+            buffer.extend(prefix)
+        buffer.extend(encode_segments(segment(string, first, charset), first, charset))
+
+        num = bisect_left(bits_table, len(buffer), first - 1, last)
+
+        if num < last:
+            return num + 1, buffer
+
+    return None
+
+
+def service_fields(
+    string: str,
+    correction_level: int,
+    charset: Optional[str] = None,
+    prefix: Optional[BitBuffer] = None
+) -> tuple[int, BitBuffer]:
+    """Automatic encoding: determining the version and splitting the string
+    into segments.
+
+    Args:
+        string: The string to be encoded.
+        correction_level: Correction level.
+        charset: Codec name of byte coding (see methods.charset_name).
+        Defaults to None (UTF-8 without ECI).
+        prefix: Segments added before the data. Defaults to None.
+
+    Returns:
+        Version, encoded data with service information.
+    """
+    result = fit(string, correction_level, charset, prefix)
+
+    if result is None:
+        raise Exception("Error! Too much encoded data!")
+
+    version, buffer = result
+    mt.padding(buffer, spec.capacities(correction_level)[version - 1])
+
+    return version, buffer
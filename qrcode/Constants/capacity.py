@@ -0,0 +1,147 @@
+"""
+This module contains the capacity index: the mode indicators, the lengths of
+the character count fields and the maximum number of characters of every
+coding type, correction level and version.
+"""
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Optional
+
+from qrcode.Constants import const, spec
+
+
+MODE_INDICATORS = {
+    const.TYPE_DIGIT: 0b0001,
+    const.TYPE_ALPHA: 0b0010,
+    const.TYPE_BYTE: 0b0100,
+    const.TYPE_KANJI: 0b1000
+}
+
+# length of the character count field for versions 1-9, 10-26 and 27-40
+COUNT_BITS = {
+    const.TYPE_DIGIT: (10, 12, 14),
+    const.TYPE_ALPHA: (9, 11, 13),
+    const.TYPE_BYTE: (8, 16, 16),
+    const.TYPE_KANJI: (8, 10, 12)
+}
+
+VERSION_RANGES = ((1, 9), (10, 26), (27, 40))
+
+
+def count_bits(encoding_type: int, version: int) -> int:
+    """Length of the character count field.
+
+    Args:
+        encoding_type: Coding type.
+        version: QR code version.
+
+    Returns:
+        Number of bits.
+    """
+    if encoding_type not in COUNT_BITS:
+        raise Exception("Error! Invalid encoding type entered!")
+
+    for num, (first, last) in enumerate(VERSION_RANGES):
+        if first <= version <= last:
+            return COUNT_BITS[encoding_type][num]
+
+    raise Exception("Error! Incorrect version entered.")
+
+
+def payload_bits(encoding_type: int, amount: int) -> int:
+    """Length of the encoded data without service information.
+
+    Args:
+        encoding_type: Coding type.
+        amount: Number of characters (bytes for byte coding).
+
+    Returns:
+        Number of bits.
+    """
+    if encoding_type == const.TYPE_DIGIT:
+        return 10 * (amount // 3) + (0, 4, 7)[amount % 3]
+
+    elif encoding_type == const.TYPE_ALPHA:
+        return 11 * (amount // 2) + 6 * (amount % 2)
+
+    elif encoding_type == const.TYPE_BYTE:
+        return 8 * amount
+
+    elif encoding_type == const.TYPE_KANJI:
+        return 13 * amount
+
+    else:
+        raise Exception("Error! Invalid encoding type entered!")
+
+
+@lru_cache(maxsize=None)
+def characters(encoding_type: int, correction_level: int) -> tuple[int, ...]:
+    """Maximum number of characters of every version (cached).
+
+    Args:
+        encoding_type: Coding type.
+        correction_level: Correction level.
+
+    Returns:
+        Tuple of numbers of characters (bytes for byte coding), the
+        version 1 is at index 0.
+    """
+    result = []
+
+    for version, bits in enumerate(spec.capacities(correction_level), 1):
+        free = bits - 4 - count_bits(encoding_type, version)
+
+        # the largest amount that fits, the payload grows monotonically
+        amount = free // payload_bits(encoding_type, 1)
+        while payload_bits(encoding_type, amount + 1) <= free:
+            amount += 1
+        while amount and payload_bits(encoding_type, amount) > free:
+            amount -= 1
+
+        result.append(min(amount, (1 << count_bits(encoding_type, version)) - 1))
+
+    return tuple(result)
+
+
+def capacity(encoding_type: int, correction_level: int, version: int) -> int:
+    """Maximum number of characters.
+
+    Args:
+        encoding_type: Coding type.
+        correction_level: Correction level.
+        version: QR code version.
+
+    Returns:
+        Number of characters (bytes for byte coding).
+    """
+    if not 1 <= version <= 40:
+        raise Exception("Error! Incorrect version entered.")
+
+    return characters(encoding_type, correction_level)[version - 1]
+
+
+def select_version(
+    encoding_type: int,
+    correction_level: int,
+    bits_length: int
+) -> Optional[int]:
+    """The smallest version that fits the data.
+
+    Args:
+        encoding_type: Coding type.
+        correction_level: Correction level.
+        bits_length: Length of the encoded data without service information.
+
+    Returns:
+        QR code version, None if the data does not fit into version 40.
+    """
+    bits_table = spec.capacities(correction_level)
+
+    for first, last in VERSION_RANGES:
+        needed = 4 + count_bits(encoding_type, first) + bits_length
+        num = bisect_left(bits_table, needed, first - 1, last)
+
+        if num < last:
+            return num + 1
+
+    return None
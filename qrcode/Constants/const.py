@@ -1,8 +1,21 @@
 TYPE_BYTE = 0
 TYPE_ALPHA = 1
 TYPE_DIGIT = 2
+TYPE_AUTO = 3
+TYPE_KANJI = 4
 
 LEVEL_L = 0
 LEVEL_M = 1
 LEVEL_Q = 2
 LEVEL_H = 3
+
+BACKEND_PYTHON = 0
+BACKEND_NUMPY = 1
+
+MASK_FULL = 0
+MASK_FAST = 1
+MASK_FIXED = 2
+
+SYMBOL_QR = 0
+SYMBOL_MICRO = 1
+SYMBOL_RMQR = 2
@@ -0,0 +1,178 @@
+"""
+This module contains the tables of Micro QR codes (versions M1-M4). M1 has
+error detection only and is used for the correction level L, the level H is
+not available.
+"""
+from qrcode.Constants import const
+
+
+def size_table() -> dict[int, int]:
+    """Micro QR code size table.
+
+    Returns:
+        dict[int, int]: Dictionary of the form {version: size}
+    """
+    table = {
+        1: 11, 2: 13, 3: 15, 4: 17
+    }
+
+    return table
+
+
+def symbol_number_table() -> dict[tuple[int, int], int]:
+    """Table of the symbol numbers written into the format information.
+
+    Returns:
+        dict[tuple[int, int], int]: Dictionary of the form {(version,
+        correction level): symbol number}
+    """
+    table = {
+        (1, const.LEVEL_L): 0,
+        (2, const.LEVEL_L): 1, (2, const.LEVEL_M): 2,
+        (3, const.LEVEL_L): 3, (3, const.LEVEL_M): 4,
+        (4, const.LEVEL_L): 5, (4, const.LEVEL_M): 6, (4, const.LEVEL_Q): 7
+    }
+
+    return table
+
+
+def bits_table() -> dict[tuple[int, int], int]:
+    """Table of the maximum amount of data. The last data codeword of M1
+    and M3 is 4 bits long.
+
+    Returns:
+        dict[tuple[int, int], int]: Dictionary of the form {(version,
+        correction level): number of bits}
+    """
+    table = {
+        (1, const.LEVEL_L): 20,
+        (2, const.LEVEL_L): 40, (2, const.LEVEL_M): 32,
+        (3, const.LEVEL_L): 84, (3, const.LEVEL_M): 68,
+        (4, const.LEVEL_L): 128, (4, const.LEVEL_M): 112, (4, const.LEVEL_Q): 80
+    }
+
+    return table
+
+
+def correction_byte_table() -> dict[tuple[int, int], int]:
+    """Table of the number of correction bytes (a Micro QR code has one
+    block).
+
+    Returns:
+        dict[tuple[int, int], int]: Dictionary of the form {(version,
+        correction level): number of correction bytes}
+    """
+    table = {
+        (1, const.LEVEL_L): 2,
+        (2, const.LEVEL_L): 5, (2, const.LEVEL_M): 6,
+        (3, const.LEVEL_L): 6, (3, const.LEVEL_M): 8,
+        (4, const.LEVEL_L): 8, (4, const.LEVEL_M): 10, (4, const.LEVEL_Q): 14
+    }
+
+    return table
+
+
+def mode_indicator_table() -> dict[int, int]:
+    """Table of the mode indicator lengths (M1 has digital coding only and
+    no mode indicator).
+
+    Returns:
+        dict[int, int]: Dictionary of the form {version: number of bits}
+    """
+    table = {
+        1: 0, 2: 1, 3: 2, 4: 3
+    }
+
+    return table
+
+
+def mode_table() -> dict[int, int]:
+    """Table of the mode indicators.
+
+    Returns:
+        dict[int, int]: Dictionary of the form {coding type: mode indicator}
+    """
+    table = {
+        const.TYPE_DIGIT: 0b000,
+        const.TYPE_ALPHA: 0b001,
+        const.TYPE_BYTE: 0b010,
+        const.TYPE_KANJI: 0b011
+    }
+
+    return table
+
+
+def count_bits_table() -> dict[int, tuple[int, ...]]:
+    """Table of the character count field lengths, None if the coding is
+    not available in the version.
+
+    Returns:
+        dict[int, tuple[int, ...]]: Dictionary of the form {coding type:
+        (number of bits for M1, M2, M3, M4)}
+    """
+    table = {
+        const.TYPE_DIGIT: (3, 4, 5, 6),
+        const.TYPE_ALPHA: (None, 3, 4, 5),
+        const.TYPE_BYTE: (None, None, 4, 5),
+        const.TYPE_KANJI: (None, None, 3, 4)
+    }
+
+    return table
+
+
+def terminator_table() -> dict[int, int]:
+    """Table of the terminator lengths.
+
+    Returns:
+        dict[int, int]: Dictionary of the form {version: number of bits}
+    """
+    table = {
+        1: 3, 2: 5, 3: 7, 4: 9
+    }
+
+    return table
+
+
+def mask_table() -> dict[int, int]:
+    """Table of the Micro QR code masks, they are four of the QR code masks
+    (see tables.mask_table).
+
+    Returns:
+        dict[int, int]: Dictionary of the form {mask number: QR code mask
+        number}
+    """
+    table = {
+        0: 1, 1: 4, 2: 6, 3: 7
+    }
+
+    return table
+
+
+def format_table() -> dict[tuple[int, int], str]:
+    """Table of the format information: symbol number and mask code
+    (XORed with 100010001000101).
+
+    Returns:
+        dict[tuple[int, int], str]: Dictionary of the form {(symbol number,
+        mask number): format code}
+    """
+    table = {
+        (0, 0): "100010001000101", (0, 1): "100000101110010",
+        (0, 2): "100111000101011", (0, 3): "100101100011100",
+        (1, 0): "101010110101110", (1, 1): "101000010011001",
+        (1, 2): "101111111000000", (1, 3): "101101011110111",
+        (2, 0): "110011110010011", (2, 1): "110001010100100",
+        (2, 2): "110110111111101", (2, 3): "110100011001010",
+        (3, 0): "111011001111000", (3, 1): "111001101001111",
+        (3, 2): "111110000010110", (3, 3): "111100100100001",
+        (4, 0): "000011011011110", (4, 1): "000001111101001",
+        (4, 2): "000110010110000", (4, 3): "000100110000111",
+        (5, 0): "001011100110101", (5, 1): "001001000000010",
+        (5, 2): "001110101011011", (5, 3): "001100001101100",
+        (6, 0): "010010100001000", (6, 1): "010000000111111",
+        (6, 2): "010111101100110", (6, 3): "010101001010001",
+        (7, 0): "011010011100011", (7, 1): "011000111010100",
+        (7, 2): "011111010001101", (7, 3): "011101110111010"
+    }
+
+    return table
@@ -0,0 +1,297 @@
+"""
+This module contains the tables of rectangular Micro QR codes (rMQR, 32
+sizes from R7x43 to R17x139). Versions are numbered from 1 in the order of
+the version indicator, only the correction levels M and H are available.
+"""
+from qrcode.Constants import const
+
+
+def size_table() -> dict[int, tuple[int, int]]:
+    """rMQR code size table.
+
+    Returns:
+        dict[int, tuple[int, int]]: Dictionary of the form {version:
+        (height, width)}
+    """
+    table = {
+        1: (7, 43), 2: (7, 59), 3: (7, 77), 4: (7, 99), 5: (7, 139),
+        6: (9, 43), 7: (9, 59), 8: (9, 77), 9: (9, 99), 10: (9, 139),
+        11: (11, 27), 12: (11, 43), 13: (11, 59), 14: (11, 77), 15: (11, 99), 16: (11, 139),
+        17: (13, 27), 18: (13, 43), 19: (13, 59), 20: (13, 77), 21: (13, 99), 22: (13, 139),
+        23: (15, 43), 24: (15, 59), 25: (15, 77), 26: (15, 99), 27: (15, 139),
+        28: (17, 43), 29: (17, 59), 30: (17, 77), 31: (17, 99), 32: (17, 139)
+    }
+
+    return table
+
+
+def alignment_patterns_table() -> dict[int, list[int]]:
+    """Columns of the alignment patterns and vertical sync bars.
+
+    Returns:
+        dict[int, list[int]]: Dictionary of the form {width: list of
+        columns}
+    """
+    table = {
+        27: [],
+        43: [21],
+        59: [19, 39],
+        77: [25, 51],
+        99: [23, 49, 75],
+        139: [27, 55, 83, 111]
+    }
+
+    return table
+
+
+def bits_table_m() -> dict[int, int]:
+    """Table of the maximum amount of data for correction level M.
+
+    Returns:
+        dict[int, int]: Dictionary of the form {version: number of bits}
+    """
+    table = {
+        1: 48, 2: 96, 3: 160, 4: 224, 5: 352,
+        6: 96, 7: 168, 8: 248, 9: 336, 10: 504,
+        11: 56, 12: 152, 13: 248, 14: 344, 15: 456, 16: 672,
+        17: 96, 18: 216, 19: 304, 20: 424, 21: 584, 22: 848,
+        23: 264, 24: 384, 25: 536, 26: 704, 27: 1016,
+        28: 312, 29: 448, 30: 624, 31: 800, 32: 1216
+    }
+
+    return table
+
+
+def bits_table_h() -> dict[int, int]:
+    """Table of the maximum amount of data for correction level H.
+
+    Returns:
+        dict[int, int]: Dictionary of the form {version: number of bits}
+    """
+    table = {
+        1: 24, 2: 56, 3: 80, 4: 112, 5: 192,
+        6: 56, 7: 88, 8: 136, 9: 176, 10: 264,
+        11: 40, 12: 88, 13: 120, 14: 184, 15: 232, 16: 336,
+        17: 56, 18: 104, 19: 160, 20: 232, 21: 280, 22: 432,
+        23: 120, 24: 208, 25: 248, 26: 384, 27: 552,
+        28: 168, 29: 224, 30: 304, 31: 448, 32: 608
+    }
+
+    return table
+
+
+def blocks_table_m() -> dict[int, int]:
+    """Table of the number of blocks for correction level M.
+
+    Returns:
+        dict[int, int]: Dictionary of the form {version: number of blocks}
+    """
+    table = {
+        1: 1, 2: 1, 3: 1, 4: 1, 5: 1,
+        6: 1, 7: 1, 8: 1, 9: 1, 10: 2,
+        11: 1, 12: 1, 13: 1, 14: 1, 15: 2, 16: 2,
+        17: 1, 18: 1, 19: 1, 20: 2, 21: 2, 22: 3,
+        23: 1, 24: 1, 25: 2, 26: 2, 27: 3,
+        28: 1, 29: 2, 30: 2, 31: 3, 32: 4
+    }
+
+    return table
+
+
+def blocks_table_h() -> dict[int, int]:
+    """Table of the number of blocks for correction level H.
+
+    Returns:
+        dict[int, int]: Dictionary of the form {version: number of blocks}
+    """
+    table = {
+        1: 1, 2: 1, 3: 1, 4: 1, 5: 2,
+        6: 1, 7: 1, 8: 2, 9: 2, 10: 3,
+        11: 1, 12: 1, 13: 2, 14: 2, 15: 2, 16: 3,
+        17: 1, 18: 1, 19: 2, 20: 2, 21: 3, 22: 4,
+        23: 2, 24: 2, 25: 3, 26: 4, 27: 5,
+        28: 2, 29: 2, 30: 3, 31: 4, 32: 6
+    }
+
+    return table
+
+
+def correction_byte_table_m() -> dict[int, int]:
+    """Table of the number of correction bytes per block for correction
+    level M.
+
+    Returns:
+        dict[int, int]: Dictionary of the form {version: number of correction
+        bytes}
+    """
+    table = {
+        1: 7, 2: 9, 3: 12, 4: 16, 5: 24,
+        6: 9, 7: 12, 8: 18, 9: 24, 10: 18,
+        11: 8, 12: 12, 13: 16, 14: 24, 15: 16, 16: 24,
+        17: 9, 18: 14, 19: 22, 20: 16, 21: 20, 22: 20,
+        23: 18, 24: 26, 25: 18, 26: 24, 27: 24,
+        28: 22, 29: 16, 30: 22, 31: 20, 32: 20
+    }
+
+    return table
+
+
+def correction_byte_table_h() -> dict[int, int]:
+    """Table of the number of correction bytes per block for correction
+    level H.
+
+    Returns:
+        dict[int, int]: Dictionary of the form {version: number of correction
+        bytes}
+    """
+    table = {
+        1: 10, 2: 14, 3: 22, 4: 30, 5: 22,
+        6: 14, 7: 22, 8: 16, 9: 22, 10: 22,
+        11: 10, 12: 20, 13: 16, 14: 22, 15: 30, 16: 30,
+        17: 14, 18: 28, 19: 20, 20: 28, 21: 26, 22: 28,
+        23: 18, 24: 24, 25: 24, 26: 22, 27: 26,
+        28: 20, 29: 30, 30: 28, 31: 26, 32: 26
+    }
+
+    return table
+
+
+def mode_table() -> dict[int, int]:
+    """Table of the mode indicators (3 bits).
+
+    Returns:
+        dict[int, int]: Dictionary of the form {coding type: mode indicator}
+    """
+    table = {
+        const.TYPE_DIGIT: 0b001,
+        const.TYPE_ALPHA: 0b010,
+        const.TYPE_BYTE: 0b011,
+        const.TYPE_KANJI: 0b100
+    }
+
+    return table
+
+
+def count_bits_table() -> dict[int, tuple[int, ...]]:
+    """Table of the character count field lengths.
+
+    Returns:
+        dict[int, tuple[int, ...]]: Dictionary of the form {coding type:
+        (number of bits for every version)}
+    """
+    table = {
+        const.TYPE_DIGIT: (
+            4, 5, 6, 7, 7,
+            5, 6, 7, 7, 8,
+            4, 6, 7, 7, 8, 8,
+            5, 6, 7, 7, 8, 8,
+            7, 7, 8, 8, 9,
+            7, 8, 8, 8, 9
+        ),
+        const.TYPE_ALPHA: (
+            3, 5, 5, 6, 6,
+            5, 5, 6, 6, 7,
+            4, 5, 6, 6, 7, 7,
+            5, 6, 6, 7, 7, 8,
+            6, 7, 7, 7, 8,
+            6, 7, 7, 8, 8
+        ),
+        const.TYPE_BYTE: (
+            3, 4, 5, 5, 6,
+            4, 5, 5, 6, 6,
+            3, 5, 5, 6, 6, 7,
+            4, 5, 6, 6, 7, 7,
+            6, 6, 7, 7, 7,
+            6, 6, 7, 7, 8
+        ),
+        const.TYPE_KANJI: (
+            2, 3, 4, 5, 5,
+            3, 4, 5, 5, 6,
+            2, 4, 5, 5, 6, 6,
+            3, 5, 5, 6, 6, 7,
+            5, 5, 6, 6, 7,
+            5, 6, 6, 6, 7
+        )
+    }
+
+    return table
+
+
+def format_table() -> dict[tuple[int, int], tuple[str, str]]:
+    """Table of the format information: correction level and version
+    indicator with the BCH code, XORed with 011111101010110010 next to the
+    search pattern and with 100000101001111011 next to the search
+    sub-pattern.
+
+    Returns:
+        dict[tuple[int, int], tuple[str, str]]: Dictionary of the form
+        {(version, correction level): (left code, right code)}
+    """
+    table = {
+        (1, const.LEVEL_M): ("011111101010110010", "100000101001111011"),
+        (1, const.LEVEL_H): ("111111001101100111", "000000001110101110"),
+        (2, const.LEVEL_M): ("011110010110010111", "100001010101011110"),
+        (2, const.LEVEL_H): ("111110110001000010", "000001110010001011"),
+        (3, const.LEVEL_M): ("011101101111011101", "100010101100010100"),
+        (3, const.LEVEL_H): ("111101001000001000", "000010001011000001"),
+        (4, const.LEVEL_M): ("011100010011111000", "100011010000110001"),
+        (4, const.LEVEL_H): ("111100110100101101", "000011110111100100"),
+        (5, const.LEVEL_M): ("011011100001101100", "100100100010100101"),
+        (5, const.LEVEL_H): ("111011000110111001", "000100000101110000"),
+        (6, const.LEVEL_M): ("011010011101001001", "100101011110000000"),
+        (6, const.LEVEL_H): ("111010111010011100", "000101111001010101"),
+        (7, const.LEVEL_M): ("011001100100000011", "100110100111001010"),
+        (7, const.LEVEL_H): ("111001000011010110", "000110000000011111"),
+        (8, const.LEVEL_M): ("011000011000100110", "100111011011101111"),
+        (8, const.LEVEL_H): ("111000111111110011", "000111111100111010"),
+        (9, const.LEVEL_M): ("010111111100001110", "101000111111000111"),
+        (9, const.LEVEL_H): ("110111011011011011", "001000011000010010"),
+        (10, const.LEVEL_M): ("010110000000101011", "101001000011100010"),
+        (10, const.LEVEL_H): ("110110100111111110", "001001100100110111"),
+        (11, const.LEVEL_M): ("010101111001100001", "101010111010101000"),
+        (11, const.LEVEL_H): ("110101011110110100", "001010011101111101"),
+        (12, const.LEVEL_M): ("010100000101000100", "101011000110001101"),
+        (12, const.LEVEL_H): ("110100100010010001", "001011100001011000"),
+        (13, const.LEVEL_M): ("010011110111010000", "101100110100011001"),
+        (13, const.LEVEL_H): ("110011010000000101", "001100010011001100"),
+        (14, const.LEVEL_M): ("010010001011110101", "101101001000111100"),
+        (14, const.LEVEL_H): ("110010101100100000", "001101101111101001"),
+        (15, const.LEVEL_M): ("010001110010111111", "101110110001110110"),
+        (15, const.LEVEL_H): ("110001010101101010", "001110010110100011"),
+        (16, const.LEVEL_M): ("010000001110011010", "101111001101010011"),
+        (16, const.LEVEL_H): ("110000101001001111", "001111101010000110"),
+        (17, const.LEVEL_M): ("001111000111001010", "110000000100000011"),
+        (17, const.LEVEL_H): ("101111100000011111", "010000100011010110"),
+        (18, const.LEVEL_M): ("001110111011101111", "110001111000100110"),
+        (18, const.LEVEL_H): ("101110011100111010", "010001011111110011"),
+        (19, const.LEVEL_M): ("001101000010100101", "110010000001101100"),
+        (19, const.LEVEL_H): ("101101100101110000", "010010100110111001"),
+        (20, const.LEVEL_M): ("001100111110000000", "110011111101001001"),
+        (20, const.LEVEL_H): ("101100011001010101", "010011011010011100"),
+        (21, const.LEVEL_M): ("001011001100010100", "110100001111011101"),
+        (21, const.LEVEL_H): ("101011101011000001", "010100101000001000"),
+        (22, const.LEVEL_M): ("001010110000110001", "110101110011111000"),
+        (22, const.LEVEL_H): ("101010010111100100", "010101010100101101"),
+        (23, const.LEVEL_M): ("001001001001111011", "110110001010110010"),
+        (23, const.LEVEL_H): ("101001101110101110", "010110101101100111"),
+        (24, const.LEVEL_M): ("001000110101011110", "110111110110010111"),
+        (24, const.LEVEL_H): ("101000010010001011", "010111010001000010"),
+        (25, const.LEVEL_M): ("000111010001110110", "111000010010111111"),
+        (25, const.LEVEL_H): ("100111110110100011", "011000110101101010"),
+        (26, const.LEVEL_M): ("000110101101010011", "111001101110011010"),
+        (26, const.LEVEL_H): ("100110001010000110", "011001001001001111"),
+        (27, const.LEVEL_M): ("000101010100011001", "111010010111010000"),
+        (27, const.LEVEL_H): ("100101110011001100", "011010110000000101"),
+        (28, const.LEVEL_M): ("000100101000111100", "111011101011110101"),
+        (28, const.LEVEL_H): ("100100001111101001", "011011001100100000"),
+        (29, const.LEVEL_M): ("000011011010101000", "111100011001100001"),
+        (29, const.LEVEL_H): ("100011111101111101", "011100111110110100"),
+        (30, const.LEVEL_M): ("000010100110001101", "111101100101000100"),
+        (30, const.LEVEL_H): ("100010000001011000", "011101000010010001"),
+        (31, const.LEVEL_M): ("000001011111000111", "111110011100001110"),
+        (31, const.LEVEL_H): ("100001111000010010", "011110111011011011"),
+        (32, const.LEVEL_M): ("000000100011100010", "111111100000101011"),
+        (32, const.LEVEL_H): ("100000000100110111", "011111000111111110")
+    }
+
+    return table
@@ -0,0 +1,155 @@
+"""
+This module contains the symbol layout specification for every version and
+correction level. Specifications are built from the tables once per process.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import Optional
+
+from qrcode.Constants import tables, const
+
+
+@dataclass(frozen=True)
+class SymbolSpec:
+    """Layout of a QR code symbol of a specific version and correction level.
+
+    Attributes:
+        version: QR code version.
+        correction_level: Correction level.
+        size: Matrix size in modules.
+        data_bits: Maximum amount of data (bits).
+        block_sizes: Number of data bytes in each block.
+        ec_codewords: Number of correction bytes per block.
+        interleave: Order in which the bytes of all data blocks followed by
+        all correction blocks are placed into the combined block.
+        alignment: Centers of the alignment patterns.
+        format_codes: Mask and correction level codes by mask number.
+        version_code: Three-line version code (from version 7).
+    """
+    version: int
+    correction_level: int
+    size: int
+    data_bits: int
+    block_sizes: tuple[int, ...]
+    ec_codewords: int
+    interleave: tuple[int, ...]
+    alignment: tuple[tuple[int, int], ...]
+    format_codes: tuple[str, ...]
+    version_code: Optional[tuple[str, ...]]
+
+
+def _level_tables(correction_level: int) -> tuple[dict, dict, dict, dict]:
+    if correction_level == const.LEVEL_L:
+        return (tables.bits_table_l(), tables.blocks_table_l(),
+                tables.correction_byte_table_l(), tables.mask_table_l())
+
+    elif correction_level == const.LEVEL_M:
+        return (tables.bits_table_m(), tables.blocks_table_m(),
+                tables.correction_byte_table_m(), tables.mask_table_m())
+
+    elif correction_level == const.LEVEL_Q:
+        return (tables.bits_table_q(), tables.blocks_table_q(),
+                tables.correction_byte_table_q(), tables.mask_table_q())
+
+    elif correction_level == const.LEVEL_H:
+        return (tables.bits_table_h(), tables.blocks_table_h(),
+                tables.correction_byte_table_h(), tables.mask_table_h())
+
+    else:
+        raise Exception("Error! Incorrect correction level entered.")
+
+
+def _alignment_points(version: int) -> tuple[tuple[int, int], ...]:
+    if version == 1:
+        return ()
+
+    patterns = tables.alignment_patterns_table().get(version)
+
+    if version > 6:
+        points = list(product(patterns, patterns))
+        points.remove((patterns[0], patterns[0]))
+        points.remove((patterns[0], patterns[-1]))
+        points.remove((patterns[-1], patterns[0]))
+    else:
+        points = [(patterns[0], patterns[0])]
+
+    return tuple(points)
+
+
+def interleave_order(block_sizes: tuple[int, ...], ec_codewords: int) -> tuple[int, ...]:
+    """Order of the codewords in the combined block: data bytes of all
+    blocks byte by byte, then the correction bytes in the same way.
+
+    Args:
+        block_sizes: Number of data bytes of each block.
+        ec_codewords: Number of correction bytes per block.
+
+    Returns:
+        Indices into the data blocks followed by the correction blocks.
+    """
+    offsets = [sum(block_sizes[:i]) for i in range(len(block_sizes))]
+    data_amount = sum(block_sizes)
+
+    order = []
+    for i in range(max(block_sizes)):
+        for offset, block_size in zip(offsets, block_sizes):
+            if i < block_size:
+                order.append(offset + i)
+
+    for i in range(ec_codewords):
+        for num in range(len(block_sizes)):
+            order.append(data_amount + num * ec_codewords + i)
+
+    return tuple(order)
+
+
+@lru_cache(maxsize=None)
+def get(version: int, correction_level: int) -> SymbolSpec:
+    """Symbol specification (cached).
+
+    Args:
+        version: QR code version.
+        correction_level: Correction level.
+
+    Returns:
+        Symbol specification.
+    """
+    bits_table, blocks_table, correction_table, codes_table = _level_tables(correction_level)
+
+    if version not in bits_table:
+        raise Exception("Error! Incorrect version entered.")
+
+    data_bits = bits_table.get(version)
+    num_of_blocks = blocks_table.get(version)
+    ec_codewords = correction_table.get(version)
+
+    block_size, num_of_add = divmod(data_bits // 8, num_of_blocks)
+    block_sizes = ((block_size,) * (num_of_blocks - num_of_add)
+                   + (block_size + 1,) * num_of_add)
+
+    return SymbolSpec(
+        version=version,
+        correction_level=correction_level,
+        size=tables.qrcode_size_table().get(version),
+        data_bits=data_bits,
+        block_sizes=block_sizes,
+        ec_codewords=ec_codewords,
+        interleave=interleave_order(block_sizes, ec_codewords),
+        alignment=_alignment_points(version),
+        format_codes=tuple(codes_table.get(num) for num in range(8)),
+        version_code=tables.version_code_table().get(version)
+    )
+
+
+@lru_cache(maxsize=None)
+def capacities(correction_level: int) -> tuple[int, ...]:
+    """Maximum amount of data (bits) of every version.
+
+    Args:
+        correction_level: Correction level.
+
+    Returns:
+        Tuple of numbers of bits, the version 1 is at index 0.
+    """
+    return tuple(get(version, correction_level).data_bits for version in range(1, 41))
@@ -147,12 +147,26 @@ def generating_polynomials_table() -> dict[int, tuple[int]]:
         bytes: polynomial coefficients}
     """
     table = {
+        2: (25, 1),
+
+        5: (113, 164, 166, 119, 10),
+
+        6: (166, 0, 134, 5, 176, 15),
+
         7: (87, 229, 146, 149, 238, 102, 21),
 
+        8: (175, 238, 208, 249, 215, 252, 196, 28),
+
+        9: (95, 246, 137, 231, 235, 149, 11, 123, 36),
+
         10: (251, 67, 46, 61, 118, 70, 64, 94, 32, 45),
 
+        12: (102, 43, 98, 121, 187, 113, 198, 143, 131, 87, 157, 66),
+
         13: (74, 152, 176, 100, 86, 100, 106, 104, 130, 218, 206, 140, 78),
 
+        14: (199, 249, 155, 48, 190, 124, 218, 137, 216, 87, 207, 59, 22, 91),
+
         15: (8, 183, 61, 91, 202, 37, 51, 58, 58, 237, 140, 124, 5, 99, 105),
 
         16: (120, 104, 107, 109, 102, 161, 76, 3, 91, 191, 147, 169, 182, 194,
@@ -601,3 +615,23 @@ def gf_reversed_table() -> dict[int, int]:
     }
 
     return table
+
+
+def eci_table() -> dict[str, int]:
+    """ECI assignment numbers of the character sets.
+
+    Returns:
+        dict[str, int]: A dictionary that contains data in the form
+        (Python codec name: ECI assignment number)
+    """
+    table = {
+        'cp437': 2, 'iso8859-1': 3, 'iso8859-2': 4, 'iso8859-3': 5,
+        'iso8859-4': 6, 'iso8859-5': 7, 'iso8859-6': 8, 'iso8859-7': 9,
+        'iso8859-8': 10, 'iso8859-9': 11, 'iso8859-10': 12, 'iso8859-11': 13,
+        'iso8859-13': 15, 'iso8859-14': 16, 'iso8859-15': 17, 'iso8859-16': 18,
+        'shift_jis': 20, 'cp1250': 21, 'cp1251': 22, 'cp1252': 23,
+        'cp1256': 24, 'utf-16-be': 25, 'utf-8': 26, 'ascii': 27, 'big5': 28,
+        'gb2312': 29, 'euc_kr': 30, 'gb18030': 32
+    }
+
+    return table
@@ -1,103 +1,267 @@
+from functools import lru_cache
+
 from PIL import Image, ImageDraw
 
-from qrcode.Point.point import Point
+from qrcode.Matrix.symbol import Symbol
+
+
+# number of distinct module shapes kept by shape_tile and union_tile
+TILE_CACHE_SIZE = 1024
+
+# (row, column) offsets of the neighbours, bit k of a configuration code is
+# the neighbour k: NW, N, NE, E, SE, S, SW, W
+NEIGHBOURS = ((-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1))
+NW, N, NE, E, SE, S, SW, W = (1 << k for k in range(8))
+
+
+# module bits (0 or 1) to mask levels
+MASK_LEVELS = bytes([0, 255]) + bytes(254)
+
+
+def module_mask(img: Image, matrix: Symbol, border: int, step: int) -> Image:
+    # one pixel per module scaled by step, then widened by one pixel to the
+    # right and down: ImageDraw rectangles include their far edges
+    modules = Image.frombytes(
+        'L',
+        (matrix.width, matrix.height),
+        bytes(matrix.bits).translate(MASK_LEVELS)
+    )
+    modules = modules.resize((matrix.width * step, matrix.height * step), Image.NEAREST)
+
+    mask = Image.new('L', img.size, 0)
+    for x, y in ((0, 0), (1, 0), (0, 1), (1, 1)):
+        mask.paste(255, (border * step + x, border * step + y), modules)
+
+    return mask
+
+
+@lru_cache(maxsize=TILE_CACHE_SIZE)
+def shape_tile(
+        shape: str,
+        width: int,
+        height: int,
+        radius: int,
+        fill_color: str,
+        outline_color: str
+) -> tuple[Image.Image, Image.Image]:
+    # a shape drawn on the box (0, 0, width, height) once per process and
+    # pasted at every module, the mask marks the pixels the shape covers
+    tile = Image.new('RGBA', (width + 1, height + 1))
+    mask = Image.new('L', (width + 1, height + 1), 0)
+
+    if shape == "ellipse":
+        ImageDraw.Draw(tile).ellipse(
+            (0, 0, width, height), fill=fill_color, outline=outline_color
+        )
+        ImageDraw.Draw(mask).ellipse((0, 0, width, height), fill=255, outline=255)
+    elif shape == "rounded_rectangle":
+        ImageDraw.Draw(tile).rounded_rectangle(
+            (0, 0, width, height), radius=radius, fill=fill_color, outline=outline_color
+        )
+        ImageDraw.Draw(mask).rounded_rectangle(
+            (0, 0, width, height), radius=radius, fill=255, outline=255
+        )
+    else:
+        raise Exception("Error! Check shape!")
+
+    return tile, mask
+
+
+def draw_tile(
+        img: Image,
+        shape: str,
+        box: tuple[int, int, int, int],
+        radius: int,
+        fill_color: str,
+        outline_color: str
+):
+    tile, mask = shape_tile(
+        shape, box[2] - box[0], box[3] - box[1], radius, fill_color, outline_color
+    )
+    img.paste(tile, box[:2], mask)
+
+
+def draw_box(img: Image, box: tuple[int, int, int, int], fill_color: str):
+    # filled ImageDraw rectangle, both edges included
+    img.paste(fill_color, (box[0], box[1], box[2] + 1, box[3] + 1))
 
 
 def rectangle(
         img: Image,
-        matrix: list[list[Point]],
+        matrix: Symbol,
         border: int,
         step: int,
         pixel_color: str,
         outline_color: str
 ):
-    for i in range(len(matrix)):
-        for j in range(len(matrix)):
-            if matrix[j][i].bit:
-                if matrix[j][i].is_pattern:
-                    ImageDraw.Draw(img).rectangle(
-                        ((i + border) * step,
-                         (j + border) * step,
-                         (i + border) * step + step,
-                         (j + border) * step + step),
-                        fill=pixel_color
-                    )
-                else:
-                    ImageDraw.Draw(img).rectangle(
-                        ((i + border) * step,
-                         (j + border) * step,
-                         (i + border) * step + step,
-                         (j + border) * step + step),
-                        fill=pixel_color,
-                        outline=outline_color
-                    )
+    if outline_color == pixel_color:
+        img.paste(pixel_color, (0, 0), module_mask(img, matrix, border, step))
+        return
+
+    for i, j, is_pattern in matrix.dark_modules():
+        if is_pattern:
+            ImageDraw.Draw(img).rectangle(
+                ((i + border) * step,
+                 (j + border) * step,
+                 (i + border) * step + step,
+                 (j + border) * step + step),
+                fill=pixel_color
+            )
+        else:
+            ImageDraw.Draw(img).rectangle(
+                ((i + border) * step,
+                 (j + border) * step,
+                 (i + border) * step + step,
+                 (j + border) * step + step),
+                fill=pixel_color,
+                outline=outline_color
+            )
 
 
 def circle(
         img: Image,
-        matrix: list[list[Point]],
+        matrix: Symbol,
         border: int,
         step: int,
         pixel_color: str,
         outline_color: str,
 ):
-    for i in range(len(matrix)):
-        for j in range(len(matrix)):
-            if matrix[j][i].bit:
-                if matrix[j][i].is_pattern:
-                    ImageDraw.Draw(img).rectangle(
-                        ((i + border) * step,
-                         (j + border) * step,
-                         (i + border) * step + step,
-                         (j + border) * step + step),
-                        fill=pixel_color
-                    )
-                else:
-                    ImageDraw.Draw(img).ellipse(
-                        ((i + border) * step,
-                         (j + border) * step,
-                         (i + border) * step + step,
-                         (j + border) * step + step),
-                        fill=pixel_color,
-                        outline=outline_color
-                    )
+    for i, j, is_pattern in matrix.dark_modules():
+        if is_pattern:
+            draw_box(
+                img,
+                ((i + border) * step,
+                 (j + border) * step,
+                 (i + border) * step + step,
+                 (j + border) * step + step),
+                pixel_color
+            )
+        else:
+            draw_tile(
+                img,
+                "ellipse",
+                ((i + border) * step,
+                 (j + border) * step,
+                 (i + border) * step + step,
+                 (j + border) * step + step),
+                0,
+                pixel_color,
+                outline_color
+            )
 
 
 def custom(
         img: Image,
-        matrix: list[list[Point]],
+        matrix: Symbol,
         border: int,
         step: int,
         radius: int,
         pixel_color: str,
         outline_color: str,
 ):
-    for i in range(len(matrix)):
-        for j in range(len(matrix)):
-            if matrix[j][i].bit:
-                if matrix[j][i].is_pattern:
-                    ImageDraw.Draw(img).rectangle(
-                        ((i + border) * step,
-                         (j + border) * step,
-                         (i + border) * step + step,
-                         (j + border) * step + step),
-                        fill=pixel_color
-                    )
-                else:
-                    ImageDraw.Draw(img).rounded_rectangle(
-                        ((i + border) * step,
-                         (j + border) * step,
-                         (i + border) * step + step,
-                         (j + border) * step + step),
-                        radius=radius,
-                        fill=pixel_color,
-                        outline=outline_color
-                    )
+    for i, j, is_pattern in matrix.dark_modules():
+        if is_pattern:
+            draw_box(
+                img,
+                ((i + border) * step,
+                 (j + border) * step,
+                 (i + border) * step + step,
+                 (j + border) * step + step),
+                pixel_color
+            )
+        else:
+            draw_tile(
+                img,
+                "rounded_rectangle",
+                ((i + border) * step,
+                 (j + border) * step,
+                 (i + border) * step + step,
+                 (j + border) * step + step),
+                radius,
+                pixel_color,
+                outline_color
+            )
+
+
+def neighbour_codes(matrix: Symbol) -> bytearray:
+    # configuration code of every module (row by row), the matrix is padded
+    # by one light module so the edges have light neighbours
+    width = matrix.width
+    height = matrix.height
+    padded_width = width + 2
+
+    padded = bytearray(padded_width * (height + 2))
+    for j in range(height):
+        start = (j + 1) * padded_width + 1
+        padded[start:start + width] = matrix.bits[j * width:(j + 1) * width]
+
+    offsets = [di * padded_width + dj for di, dj in NEIGHBOURS]
+
+    codes = bytearray(width * height)
+    for j in range(height):
+        for i in range(width):
+            pos = (j + 1) * padded_width + i + 1
+            code = 0
+            for k, offset in enumerate(offsets):
+                code |= padded[pos + offset] << k
+            codes[j * width + i] = code
+
+    return codes
+
+
+@lru_cache(maxsize=TILE_CACHE_SIZE)
+def union_tile(
+        dark: bool,
+        code: int,
+        step: int,
+        radius: int,
+        pixel_color: str,
+        bg_color: str,
+        outline_color: str
+) -> tuple[Image.Image, Image.Image]:
+    # all the shapes of one module for a configuration code, a dark module
+    # is joined to its right and lower neighbours, a light one fills the
+    # corners between three dark neighbours
+    tile = Image.new('RGBA', (2 * step + 1, 2 * step + 1))
+    mask = Image.new('L', (2 * step + 1, 2 * step + 1), 0)
+    half = step // 2
+
+    for draw, fill_color, edge_color, bg in (
+        (ImageDraw.Draw(tile), pixel_color, outline_color, bg_color),
+        (ImageDraw.Draw(mask), 255, 255, 255)
+    ):
+        if dark:
+            boxes = [(0, 0, step, step)]
+            if code & E:
+                boxes.append((0, 0, 2 * step, step))
+            if code & S:
+                boxes.append((0, 0, step, 2 * step))
+
+            for box in boxes:
+                draw.rounded_rectangle(box, radius=radius, fill=fill_color, outline=edge_color)
+
+        else:
+            corners = (
+                (W | N | NW, (0, 0, half, half)),
+                (W | SW | S, (0, half, half, step)),
+                (E | SE | S, (half, half, step, step)),
+                (E | NE | N, (half, 0, step, half))
+            )
+
+            for neighbours, box in corners:
+                if code & neighbours == neighbours:
+                    draw.rectangle(box, fill=fill_color, outline=fill_color)
+
+            draw.rounded_rectangle(
+                (1, 1, step - 1, step - 1), radius=radius, fill=bg, outline=bg
+            )
+
+    return tile, mask
 
 
 def union(
         img: Image,
-        matrix: list[list[Point]],
+        matrix: Symbol,
         border: int,
         step: int,
         radius: int,
@@ -105,114 +269,32 @@ def union(
         bg_color: str,
         outline_color: str,
 ):
-    for i in range(len(matrix)):
-        for j in range(len(matrix)):
-            if not matrix[j][i].bit:
-                if not matrix[j][i].is_pattern:
-                    if matrix[j][i - 1].bit and matrix[j - 1][i].bit and matrix[j - 1][i - 1].bit and i != 0 and j != 0:
-                        ImageDraw.Draw(img).rectangle(
-                            ((i + border) * step,
-                             (j + border) * step,
-                             (i + border) * step + step // 2,
-                             (j + border) * step + step // 2),
-                            fill=pixel_color,
-                            outline=pixel_color
-                        )
-
-                    try:
-                        if matrix[j][i - 1].bit and matrix[j + 1][i - 1].bit and matrix[j + 1][i].bit and i != 0:
-                            ImageDraw.Draw(img).rectangle(
-                                ((i + border) * step,
-                                 (j + border) * step + step//2,
-                                 (i + border) * step + step//2,
-                                 (j + border) * step + step),
-                                fill=pixel_color,
-                                outline=pixel_color
-                            )
-                    except IndexError:
-                        pass
-
-                    try:
-                        if matrix[j][i + 1].bit and matrix[j + 1][i + 1].bit and matrix[j + 1][i].bit:
-                            ImageDraw.Draw(img).rectangle(
-                                ((i + border) * step + step//2,
-                                 (j + border) * step + step//2,
-                                 (i + border) * step + step,
-                                 (j + border) * step + step),
-                                fill=pixel_color,
-                                outline=pixel_color
-                            )
-                    except IndexError:
-                        pass
-
-                    try:
-                        if matrix[j][i + 1].bit and matrix[j - 1][i + 1].bit and matrix[j - 1][i].bit and j != 0:
-                            ImageDraw.Draw(img).rectangle(
-                                ((i + border) * step + step//2,
-                                 (j + border) * step,
-                                 (i + border) * step + step,
-                                 (j + border) * step + step//2),
-                                fill=pixel_color,
-                                outline=pixel_color
-                            )
-                    except IndexError:
-                        pass
-
-                    ImageDraw.Draw(img).rounded_rectangle(
-                        ((i + border) * step + 1,
-                         (j + border) * step + 1,
-                         (i + border) * step + step - 1,
-                         (j + border) * step + step - 1),
-                        radius=radius,
-                        fill=bg_color,
-                        outline=bg_color
-                    )
+    width = matrix.width
+    bits = matrix.bits
+    pattern = matrix.pattern
+    codes = neighbour_codes(matrix)
 
-            else:
-                if matrix[j][i].is_pattern:
-                    ImageDraw.Draw(img).rectangle(
-                        ((i + border) * step,
-                         (j + border) * step,
-                         (i + border) * step + step,
-                         (j + border) * step + step),
-                        fill=pixel_color
-                    )
-                else:
-                    ImageDraw.Draw(img).rounded_rectangle(
+    for i in range(width):
+        for j in range(matrix.height):
+            index = j * width + i
+
+            if pattern[index]:
+                if bits[index]:
+                    draw_box(
+                        img,
                         ((i + border) * step,
                          (j + border) * step,
                          (i + border) * step + step,
                          (j + border) * step + step),
-                        radius=radius,
-                        fill=pixel_color,
-                        outline=outline_color
+                        pixel_color
                     )
+                continue
+
+            code = codes[index]
+            if bits[index]:
+                code &= E | S
 
-                    try:
-                        if matrix[j][i + 1].bit:
-                            ImageDraw.Draw(img).rounded_rectangle(
-                                ((i + border) * step,
-                                 (j + border) * step,
-                                 (i + border + 1) * step + step,
-                                 (j + border) * step + step),
-                                radius=radius,
-                                fill=pixel_color,
-                                outline=outline_color
-                            )
-
-                    except IndexError:
-                        pass
-
-                    try:
-                        if matrix[j + 1][i].bit:
-                            ImageDraw.Draw(img).rounded_rectangle(
-                                ((i + border) * step,
-                                 (j + border) * step,
-                                 (i + border) * step + step,
-                                 (j + border + 1) * step + step),
-                                radius=radius,
-                                fill=pixel_color,
-                                outline=outline_color
-                            )
-                    except IndexError:
-                        pass
+            tile, mask = union_tile(
+                bool(bits[index]), code, step, radius, pixel_color, bg_color, outline_color
+            )
+            img.paste(tile, ((i + border) * step, (j + border) * step), mask)
@@ -1,12 +1,18 @@
-from itertools import product
-from typing import Callable
+from functools import lru_cache
+from typing import Optional
 
-from qrcode.Point.point import Point
-from qrcode.Constants import tables, const
+from qrcode.Constants import tables, const, spec
 from qrcode.Matrix import tests
+from qrcode.Matrix import symbol
+from qrcode.Matrix.symbol import Symbol, pack, unpack
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
-def search_patterns(matrix: list[list[Point]], x: int, y: int) -> None:
+
+def search_patterns(matrix: Symbol, x: int, y: int) -> None:
     """Adding search patterns.
 
     Args:
@@ -57,33 +63,32 @@ def search_patterns(matrix: list[list[Point]], x: int, y: int) -> None:
             index_i = x + i - 1
             index_j = y + j - 1
 
-            if 0 <= index_i < len(matrix) and 0 <= index_j < len(matrix):
+            if 0 <= index_i < matrix.height and 0 <= index_j < matrix.width:
                 if not matrix[x+i-1][y+j-1].is_service_bit:
                     matrix[x+i-1][y+j-1].is_service_bit = True
                     matrix[x+i-1][y+j-1].is_pattern = True
 
 
-def sync_strips(matrix: list[list[Point]]) -> None:
+def sync_strips(matrix: Symbol) -> None:
     """Adding sync bars.
 
     Args:
         matrix: Matrix containing qr code pixels.
     """
-    count = (len(matrix) - 14) // 2
-
-    for i in range(1, count+1):
+    for i in range(1, (matrix.height - 14) // 2 + 1):
         matrix[i * 2 + 6][6].bit = True
         matrix[i * 2 + 6][6].is_service_bit = True
         matrix[i * 2 + 5][6].is_service_bit = True
         matrix[i * 2 + 7][6].is_service_bit = True
 
+    for i in range(1, (matrix.width - 14) // 2 + 1):
         matrix[6][i * 2 + 6].bit = True
         matrix[6][i * 2 + 6].is_service_bit = True
         matrix[6][i * 2 + 5].is_service_bit = True
         matrix[6][i * 2 + 7].is_service_bit = True
 
 
-def mask_correction_level(matrix: list[list[Point]], mask: str) -> None:
+def mask_correction_level(matrix: Symbol, mask: str) -> None:
     """Adding mask code and correction level.
 
     Args:
@@ -111,39 +116,32 @@ def mask_correction_level(matrix: list[list[Point]], mask: str) -> None:
         index -= 1
 
     pos_bit = 0
-    index = len(matrix)-1
-    while index >= len(matrix)-7:
+    index = matrix.height-1
+    while index >= matrix.height-7:
         matrix[index][8].is_service_bit = True
         matrix[index][8].bit = int(mask[pos_bit])
         pos_bit += 1
         index -= 1
 
-    index = len(matrix)-8
-    while index <= len(matrix)-1:
+    index = matrix.width-8
+    while index <= matrix.width-1:
         matrix[8][index].is_service_bit = True
         matrix[8][index].bit = int(mask[pos_bit])
         pos_bit += 1
         index += 1
 
 
-def alignment_patterns(matrix: list[list[Point]], version: int) -> None:
+def alignment_patterns(
+    matrix: Symbol,
+    points: tuple[tuple[int, int], ...]
+) -> None:
     """Adding alignment patterns (from version 2).
 
     Args:
         matrix: Matrix containing qr code pixels.
-        version: QR code version.
+        points: Centers of the alignment patterns.
     """
-    if version > 1:
-        patterns = tables.alignment_patterns_table().get(version)
-
-        if version > 6:
-            points = list(product(patterns, patterns))
-            points.remove((patterns[0], patterns[0]))
-            points.remove((patterns[0], patterns[-1]))
-            points.remove((patterns[-1], patterns[0]))
-        else:
-            points = [(patterns[0], patterns[0])]
-
+    if points:
         for x, y in points:
             matrix[x][y].bit = True
             matrix[x][y].is_service_bit = True
@@ -167,17 +165,18 @@ def alignment_patterns(matrix: list[list[Point]], version: int) -> None:
                         matrix[x - 2 + i][y - 2 + j].is_service_bit = True
 
 
-def version_code(matrix: list[list[Point]], version: int) -> None:
+def version_code(
+    matrix: Symbol,
+    codes: Optional[tuple[str, ...]]
+) -> None:
     """Adding version code (from version 7).
 
     Args:
         matrix: Matrix containing qr code pixels.
-        version: QR code version.
+        codes: Three-line version code.
     """
-    if version > 6:
-        codes = tables.version_code_table().get(version)
-
-        pos = len(matrix) - 11
+    if codes is not None:
+        pos = matrix.height - 11
 
         for i in range(6):
             # left down
@@ -190,6 +189,9 @@ def version_code(matrix: list[list[Point]], version: int) -> None:
             matrix[pos + 2][i].bit = int(codes[2][i])
             matrix[pos + 2][i].is_service_bit = True
 
+        pos = matrix.width - 11
+
+        for i in range(6):
             # right up
             matrix[i][pos].bit = int(codes[0][i])
             matrix[i][pos].is_service_bit = True
@@ -202,153 +204,314 @@ def version_code(matrix: list[list[Point]], version: int) -> None:
 
 
 def fill_data(
-    matrix: list[list[Point]],
-    comb_blocks: list[int],
-    mask: Callable[[int, int], int]
+    matrix: Symbol,
+    order: tuple[int, ...],
+    data: bytes
 ) -> None:
-    """Adding data to qr code matrix.
+    """Adding unmasked data to qr code matrix.
 
     Args:
         matrix: Matrix containing qr code pixels.
+        order: Data module indices in the order of placement.
+        data: Data bits (one byte per bit).
+    """
+    bits = matrix.bits
+
+    for index, bit in zip(order, data):
+        bits[index] = bit
+
+
+def data_bits(comb_blocks: list[int], length: int) -> bytes:
+    """Splitting data blocks into bits.
+
+    Args:
         comb_blocks: Data blocks.
-        mask: Lambda function of a specific mask.
+        length: Number of data modules, the remaining modules are filled
+        with zero bits.
+
+    Returns:
+        Data bits (one byte per bit).
+    """
+    data = unpack(int.from_bytes(bytes(comb_blocks), 'big'), len(comb_blocks) * 8)
+
+    return data + bytes(length - len(data))
+
+
+@lru_cache(maxsize=None)
+def template(version: int) -> Symbol:
+    """Matrix with all the version-dependent service modules (search and
+    alignment patterns, sync bars, version code and a reserved area for the
+    mask code), built once per version.
+
+    Args:
+        version: QR code version.
+
+    Returns:
+        Read-only QR Code Matrix.
+    """
+    # size, alignment patterns and version code do not depend on the level
+    symbol_spec = spec.get(version, const.LEVEL_L)
+    size = symbol_spec.size
+    matrix = Symbol(size)
+
+    search_patterns(matrix, 0, 0)
+    search_patterns(matrix, size-7, 0)
+    search_patterns(matrix, 0, size-7)
+
+    matrix[size - 8][8].bit = True
+    matrix[size-8][8].is_service_bit = True
+
+    alignment_patterns(matrix, symbol_spec.alignment)
+    version_code(matrix, symbol_spec.version_code)
+    sync_strips(matrix)
+    mask_correction_level(matrix, "0" * 15)
+
+    return matrix.freeze()
+
+
+def zigzag(
+    service: bytes,
+    width: int,
+    height: int,
+    skip: Optional[int] = None
+) -> tuple[int, ...]:
+    """Data modules in the order of placement: two-module wide columns from
+    right to left, alternately up and down, skipping the service modules.
+
+    Args:
+        service: Service module flags.
+        width: Number of matrix columns.
+        height: Number of matrix rows.
+        skip: Column skipped entirely (the vertical sync bar). Defaults to None.
+
+    Returns:
+        Module indices in the order of placement.
+    """
+    order = []
+    up = True
+    pos_j = width - 1
+
+    while pos_j > 0:
+        if pos_j == skip:
+            pos_j -= 1
+
+        rows = range(height - 1, -1, -1) if up else range(height)
+        for pos_i in rows:
+            for index in (pos_i * width + pos_j, pos_i * width + pos_j - 1):
+                if not service[index]:
+                    order.append(index)
+
+        up = not up
+        pos_j -= 2
+
+    return tuple(order)
+
+
+@lru_cache(maxsize=None)
+def placement(version: int) -> tuple[int, ...]:
+    """Order of data modules: two-module wide columns from right to left,
+    alternately up and down, skipping the vertical sync bar and service modules.
+
+    Args:
+        version: QR code version.
+
+    Returns:
+        Module indices in the order of placement.
     """
-    size = len(matrix)
+    matrix = template(version)
 
-    pos_i = size - 1
-    pos_j = pos_i
+    return zigzag(matrix.service, matrix.width, matrix.height, 6)
 
-    # down=False or up=True
-    flag = True
 
-    flag_step = False
+@lru_cache(maxsize=None)
+def mask_layers(version: int) -> tuple[int, ...]:
+    """Masks restricted to the data modules.
 
-    for byte in comb_blocks:
-        byte = bin(byte)[2::].zfill(8)
-        if pos_j == -1:
-            break
+    Args:
+        version: QR code version.
 
-        for char in byte:
-            if pos_j == -1:
-                break
+    Returns:
+        Packed matrix bits (see symbol.pack) for each mask number, a bit is
+        set where the mask inverts a data module.
+    """
+    size = template(version).size
+    order = placement(version)
 
-            ready = False
-            while not ready:
-                if pos_j == -1:
-                    break
+    layers = []
+    for func_mask in tables.mask_table().values():
+        layer = bytearray(size * size)
+        for index in order:
+            pos_i, pos_j = divmod(index, size)
+            layer[index] = func_mask(pos_i, pos_j) == 0
+        layers.append(pack(layer))
 
-                if pos_j == 6:
-                    pos_j -= 1
+    return tuple(layers)
 
-                if flag:
-                    if not matrix[pos_i][pos_j].is_service_bit:
-                        matrix[pos_i][pos_j].bit = int(char)
 
-                        if mask(pos_i, pos_j) == 0:
-                            matrix[pos_i][pos_j].bit ^= 1
+@lru_cache(maxsize=None)
+def format_layers(version: int, correction_level: int) -> tuple[int, ...]:
+    """Mask and correction level codes.
 
-                        ready = True
+    Args:
+        version: QR code version.
+        correction_level: Correction level.
 
-                    if not flag_step:
-                        pos_j -= 1
-                        flag_step = True
-                    else:
-                        pos_j += 1
-                        pos_i -= 1
-                        flag_step = False
+    Returns:
+        Packed matrix bits (see symbol.pack) of the code for each mask number.
+    """
+    size = template(version).size
 
-                    if pos_i == -1:
-                        pos_i += 1
-                        pos_j -= 2
-                        flag = False
+    layers = []
+    for mask_code in spec.get(version, correction_level).format_codes:
+        matrix = Symbol(size)
+        mask_correction_level(matrix, mask_code)
+        layers.append(pack(matrix.bits))
 
-                else:
-                    if not matrix[pos_i][pos_j].is_service_bit:
-                        matrix[pos_i][pos_j].bit = int(char)
+    return tuple(layers)
 
-                        if mask(pos_i, pos_j) == 0:
-                            matrix[pos_i][pos_j].bit ^= 1
 
-                        ready = True
+@lru_cache(maxsize=None)
+def placement_array(version: int) -> "numpy.ndarray":
+    """Order of data modules as an index array (NumPy backend).
 
-                    if not flag_step:
-                        pos_j -= 1
-                        flag_step = True
-                    else:
-                        pos_j += 1
-                        pos_i += 1
-                        flag_step = False
+    Args:
+        version: QR code version.
+
+    Returns:
+        Module indices in the order of placement.
+    """
+    return numpy.array(placement(version), dtype=numpy.intp)
 
-                    if pos_i == len(matrix):
-                        pos_i -= 1
-                        pos_j -= 2
-                        flag = True
+
+@lru_cache(maxsize=None)
+def mask_arrays(version: int) -> "numpy.ndarray":
+    """Masks restricted to the data modules (NumPy backend).
+
+    Args:
+        version: QR code version.
+
+    Returns:
+        (8, size * size) uint8 array, 1 where the mask inverts a data module.
+    """
+    length = template(version).size ** 2
+    layers = b''.join(unpack(layer, length) for layer in mask_layers(version))
+
+    return numpy.frombuffer(layers, dtype=numpy.uint8).reshape(8, length)
+
+
+@lru_cache(maxsize=None)
+def format_arrays(version: int, correction_level: int) -> "numpy.ndarray":
+    """Mask and correction level codes (NumPy backend).
+
+    Args:
+        version: QR code version.
+        correction_level: Correction level.
+
+    Returns:
+        (8, size * size) uint8 array of the code bits for each mask number.
+    """
+    length = template(version).size ** 2
+    layers = b''.join(unpack(layer, length) for layer in format_layers(version, correction_level))
+
+    return numpy.frombuffer(layers, dtype=numpy.uint8).reshape(8, length)
+
+
+def select_mask(unmasked: int, version: int, correction_level: int, fast: bool) -> int:
+    """Choosing the mask by the penalty rules with the bitset engine, which
+    is faster than the NumPy one at every size and is used by both backends.
+
+    Args:
+        unmasked: Packed matrix bits (see symbol.pack) with the data placed
+        and no mask applied.
+        version: QR code version.
+        correction_level: Correction level.
+        fast: Score only the rules 2 and 4.
+
+    Returns:
+        Mask number.
+    """
+    masks = mask_layers(version)
+    codes = format_layers(version, correction_level)
+    candidates = [(unmasked ^ masks[num]) | codes[num] for num in range(8)]
+
+    return tests.select_mask_bitset(candidates, template(version).size, fast)[0]
 
 
 def create(
     comb_blocks: list[int],
     version: int,
-    correction_level: int
-) -> list[list[Point]]:
+    correction_level: int,
+    backend: int = None,
+    mask_strategy: int = const.MASK_FULL,
+    mask: int = None
+) -> Symbol:
     """Generating a QR Code Matrix.
 
     Args:
         comb_blocks: Data blocks.
         version: QR code version.
         correction_level: Correction level
+        backend: const.BACKEND_PYTHON or const.BACKEND_NUMPY. Defaults to
+        NumPy when it is installed.
+        mask_strategy: Mask selection:
+            const.MASK_FULL == all four penalty rules (ISO/IEC 18004)
 
-    Returns:
-        QR Code Matrix.
-    """
-    size = tables.qrcode_size_table().get(version)
-    matrix = [[Point() for _ in range(size)] for _ in range(size)]
-    scores = {}
-
-    if correction_level == const.LEVEL_L:
-        codes_mask_table = tables.mask_table_l()
+            const.MASK_FAST == only the cheap rules 2 and 4
 
-    elif correction_level == const.LEVEL_M:
-        codes_mask_table = tables.mask_table_m()
+            const.MASK_FIXED == the mask given by `mask`
+        mask: Mask number (0-7), implies const.MASK_FIXED.
 
-    elif correction_level == const.LEVEL_Q:
-        codes_mask_table = tables.mask_table_q()
+    Returns:
+        QR Code Matrix, the mask used and the strategy are stored in its
+        `mask` and `mask_strategy` attributes.
+    """
+    backend = symbol.get_backend(backend)
 
-    elif correction_level == const.LEVEL_H:
-        codes_mask_table = tables.mask_table_h()
+    if mask is not None:
+        mask_strategy = const.MASK_FIXED
 
-    else:
-        raise Exception("Error! Incorrect correction level entered.")
+    if mask_strategy == const.MASK_FIXED:
+        if mask not in range(8):
+            raise Exception("Error! Incorrect mask entered.")
+    elif mask_strategy not in (const.MASK_FULL, const.MASK_FAST):
+        raise Exception("Error! Incorrect mask strategy entered.")
 
-    func_mask_table = tables.mask_table()
+    fast = mask_strategy == const.MASK_FAST
 
-    search_patterns(matrix, 0, 0)
-    search_patterns(matrix, size-7, 0)
-    search_patterns(matrix, 0, size-7)
+    matrix = template(version).copy()
+    order = placement(version)
+    data = data_bits(comb_blocks, len(order))
 
-    matrix[size - 8][8].bit = True
-    matrix[size-8][8].is_service_bit = True
+    if backend == const.BACKEND_NUMPY:
+        modules = matrix.modules.reshape(-1)
+        modules[placement_array(version)] = numpy.frombuffer(data, dtype=numpy.uint8)
+        masks = mask_arrays(version)
+        codes = format_arrays(version, correction_level)
 
-    alignment_patterns(matrix, version)
-    version_code(matrix, version)
-    sync_strips(matrix)
+        if mask_strategy == const.MASK_FIXED:
+            num_mask = mask
+        else:
+            num_mask = select_mask(pack(matrix.bits), version, correction_level, fast)
 
-    for num in range(8):
-        mask_code = codes_mask_table.get(num)
-        mask_correction_level(matrix, mask_code)
+        modules ^= masks[num_mask]
+        modules |= codes[num_mask]
 
-        func_mask = func_mask_table.get(num)
-        fill_data(matrix, comb_blocks, func_mask)
+    else:
+        fill_data(matrix, order, data)
 
-        score = tests.make(matrix)
-        scores[score] = num
+        length = len(matrix.bits)
+        unmasked = pack(matrix.bits)
+        masks = mask_layers(version)
+        codes = format_layers(version, correction_level)
 
-    min_score = min(scores.keys())
-    num_mask = scores.get(min_score)
+        if mask_strategy == const.MASK_FIXED:
+            num_mask = mask
+        else:
+            num_mask = select_mask(unmasked, version, correction_level, fast)
 
-    mask_code = codes_mask_table.get(num_mask)
-    mask_correction_level(matrix, mask_code)
+        matrix.bits[:] = unpack((unmasked ^ masks[num_mask]) | codes[num_mask], length)
 
-    func_mask = func_mask_table.get(num_mask)
-    fill_data(matrix, comb_blocks, func_mask)
+    matrix.mask = num_mask
+    matrix.mask_strategy = mask_strategy
 
     return matrix
@@ -0,0 +1,232 @@
+"""
+This module contains the Micro QR code matrix: one search pattern in the
+upper left corner, sync bars along the upper and left edges, 15 modules of
+mask and correction level code and four masks, chosen by the number of dark
+modules on the right and lower edges.
+"""
+from functools import lru_cache
+
+from qrcode.Constants import tables, const, microTables
+from qrcode.Matrix.matrix import search_patterns, fill_data, zigzag
+from qrcode.Matrix.symbol import Symbol, pack, unpack
+
+
+def sync_strips(matrix: Symbol) -> None:
+    """Adding sync bars along the upper and left edges.
+
+    Args:
+        matrix: Matrix containing qr code pixels.
+    """
+    for i in range(8, len(matrix)):
+        matrix[0][i].bit = i % 2 == 0
+        matrix[0][i].is_service_bit = True
+
+        matrix[i][0].bit = i % 2 == 0
+        matrix[i][0].is_service_bit = True
+
+
+def mask_correction_level(matrix: Symbol, mask: str) -> None:
+    """Adding mask code and correction level (symbol number).
+
+    Args:
+        matrix: Matrix containing qr code pixels.
+        mask: Mask code.
+    """
+    for pos_bit in range(8):
+        matrix[8][pos_bit + 1].is_service_bit = True
+        matrix[8][pos_bit + 1].bit = int(mask[pos_bit])
+
+    for pos_bit in range(8, 15):
+        matrix[15 - pos_bit][8].is_service_bit = True
+        matrix[15 - pos_bit][8].bit = int(mask[pos_bit])
+
+
+@lru_cache(maxsize=None)
+def template(version: int) -> Symbol:
+    """Matrix with all the service modules and a reserved area for the mask
+    code, built once per version.
+
+    Args:
+        version: Micro QR code version (1-4 for M1-M4).
+
+    Returns:
+        Read-only Micro QR Code Matrix.
+    """
+    size = microTables.size_table().get(version)
+
+    if size is None:
+        raise Exception("Error! Incorrect version entered.")
+
+    matrix = Symbol(size)
+
+    search_patterns(matrix, 0, 0)
+    sync_strips(matrix)
+    mask_correction_level(matrix, "0" * 15)
+
+    return matrix.freeze()
+
+
+@lru_cache(maxsize=None)
+def placement(version: int) -> tuple[int, ...]:
+    """Order of data modules: two-module wide columns from right to left,
+    alternately up and down, skipping service modules.
+
+    Args:
+        version: Micro QR code version.
+
+    Returns:
+        Module indices in the order of placement.
+    """
+    matrix = template(version)
+
+    return zigzag(matrix.service, matrix.width, matrix.height)
+
+
+@lru_cache(maxsize=None)
+def mask_layers(version: int) -> tuple[int, ...]:
+    """Masks restricted to the data modules.
+
+    Args:
+        version: Micro QR code version.
+
+    Returns:
+        Packed matrix bits (see symbol.pack) for each mask number, a bit is
+        set where the mask inverts a data module.
+    """
+    size = template(version).size
+    order = placement(version)
+    functions = tables.mask_table()
+
+    layers = []
+    for num_mask in microTables.mask_table().values():
+        layer = bytearray(size * size)
+        for index in order:
+            pos_i, pos_j = divmod(index, size)
+            layer[index] = functions[num_mask](pos_i, pos_j) == 0
+        layers.append(pack(layer))
+
+    return tuple(layers)
+
+
+@lru_cache(maxsize=None)
+def format_layers(version: int, correction_level: int) -> tuple[int, ...]:
+    """Mask and correction level codes.
+
+    Args:
+        version: Micro QR code version.
+        correction_level: Correction level.
+
+    Returns:
+        Packed matrix bits (see symbol.pack) of the code for each mask number.
+    """
+    size = template(version).size
+    number = microTables.symbol_number_table().get((version, correction_level))
+
+    if number is None:
+        raise Exception("Error! Incorrect correction level entered.")
+
+    layers = []
+    for num_mask in microTables.mask_table():
+        matrix = Symbol(size)
+        mask_correction_level(matrix, microTables.format_table()[(number, num_mask)])
+        layers.append(pack(matrix.bits))
+
+    return tuple(layers)
+
+
+def data_bits(comb_blocks: list[int], version: int, correction_level: int) -> bytes:
+    """Splitting the data and correction bytes into bits, the last data
+    byte of M1 and M3 gives its 4 high bits only.
+
+    Args:
+        comb_blocks: Data bytes followed by the correction bytes.
+        version: Micro QR code version.
+        correction_level: Correction level.
+
+    Returns:
+        Data bits (one byte per bit).
+    """
+    bits_amount = microTables.bits_table()[(version, correction_level)]
+    data_amount = (bits_amount + 7) // 8
+
+    data = int.from_bytes(bytes(comb_blocks[:data_amount]), 'big')
+    correction = bytes(comb_blocks[data_amount:])
+
+    return (unpack(data >> (8 * data_amount - bits_amount), bits_amount)
+            + unpack(int.from_bytes(correction, 'big'), 8 * len(correction)))
+
+
+def evaluation(bits: bytes, size: int) -> int:
+    """Score of a masked matrix, the mask with the highest score is chosen.
+
+    Args:
+        bits: Matrix bits (one byte per module).
+        size: Matrix size.
+
+    Returns:
+        16 * SUM1 + SUM2, where SUM1 and SUM2 are the smaller and the larger
+        number of dark modules on the right and lower edges (without the
+        sync bars).
+    """
+    right = sum(bits[i * size + size - 1] for i in range(1, size))
+    lower = sum(bits[(size - 1) * size + j] for j in range(1, size))
+
+    return 16 * min(right, lower) + max(right, lower)
+
+
+def create(
+    comb_blocks: list[int],
+    version: int,
+    correction_level: int,
+    mask_strategy: int = const.MASK_FULL,
+    mask: int = None
+) -> Symbol:
+    """Generating a Micro QR Code Matrix.
+
+    Args:
+        comb_blocks: Data bytes followed by the correction bytes.
+        version: Micro QR code version (1-4 for M1-M4).
+        correction_level: Correction level.
+        mask_strategy: Mask selection, const.MASK_FULL and const.MASK_FAST
+        both use the evaluation of the edges, const.MASK_FIXED the mask
+        given by `mask`.
+        mask: Mask number (0-3), implies const.MASK_FIXED.
+
+    Returns:
+        Micro QR Code Matrix, the mask used and the strategy are stored in
+        its `mask` and `mask_strategy` attributes.
+    """
+    if mask is not None:
+        mask_strategy = const.MASK_FIXED
+
+    if mask_strategy == const.MASK_FIXED:
+        if mask not in range(4):
+            raise Exception("Error! Incorrect mask entered.")
+    elif mask_strategy not in (const.MASK_FULL, const.MASK_FAST):
+        raise Exception("Error! Incorrect mask strategy entered.")
+
+    matrix = template(version).copy()
+    size = matrix.size
+    length = len(matrix.bits)
+
+    fill_data(matrix, placement(version), data_bits(comb_blocks, version, correction_level))
+
+    unmasked = pack(matrix.bits)
+    masks = mask_layers(version)
+    codes = format_layers(version, correction_level)
+
+    if mask_strategy == const.MASK_FIXED:
+        num_mask = mask
+    else:
+        candidates = [
+            unpack((unmasked ^ masks[num]) | codes[num], length)
+            for num in range(4)
+        ]
+        num_mask = max(range(4), key=lambda num: evaluation(candidates[num], size))
+
+    matrix.bits[:] = unpack((unmasked ^ masks[num_mask]) | codes[num_mask], length)
+
+    matrix.mask = num_mask
+    matrix.mask_strategy = mask_strategy
+
+    return matrix
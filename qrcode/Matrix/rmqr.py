@@ -0,0 +1,249 @@
+"""
+This module contains the rectangular Micro QR code matrix (rMQR): a search
+pattern in the upper left corner, a search sub-pattern in the lower right
+corner, corner patterns in the other two, alignment patterns joined by
+vertical sync bars, two copies of the format information and a single mask.
+"""
+from functools import lru_cache
+
+from qrcode.Constants import tables, const, rmqrTables
+from qrcode.Matrix.matrix import search_patterns, fill_data, zigzag, data_bits
+from qrcode.Matrix.symbol import Symbol, pack, unpack
+
+
+# rMQR codes use the QR code mask 4 (see tables.mask_table)
+MASK = 4
+
+
+def search_sub_pattern(matrix: Symbol) -> None:
+    """Adding the search sub-pattern (5x5) in the lower right corner.
+
+    Args:
+        matrix: Matrix containing qr code pixels.
+    """
+    x = matrix.height - 5
+    y = matrix.width - 5
+
+    for i in range(5):
+        for j in range(5):
+            matrix[x + i][y + j].bit = max(abs(i - 2), abs(j - 2)) != 1
+            matrix[x + i][y + j].is_service_bit = True
+            matrix[x + i][y + j].is_pattern = True
+
+
+def corner_patterns(matrix: Symbol) -> None:
+    """Adding the corner patterns in the lower left and upper right corners.
+
+    Args:
+        matrix: Matrix containing qr code pixels.
+    """
+    height = matrix.height
+    width = matrix.width
+
+    points = [(0, width - 1, True), (0, width - 2, True),
+              (1, width - 1, True), (1, width - 2, False)]
+
+    # the search pattern takes the whole height of the smallest codes
+    if height >= 9:
+        points += [(height - 1, 0, True), (height - 1, 1, True), (height - 1, 2, True)]
+    if height >= 11:
+        points += [(height - 2, 0, True), (height - 2, 1, False)]
+
+    for x, y, bit in points:
+        matrix[x][y].bit = bit
+        matrix[x][y].is_service_bit = True
+
+
+def alignment_patterns(matrix: Symbol, columns: list[int]) -> None:
+    """Adding alignment patterns (3x3, light center) at the upper and
+    lower edges.
+
+    Args:
+        matrix: Matrix containing qr code pixels.
+        columns: Columns of the alignment pattern centers.
+    """
+    for y in columns:
+        for x in (1, matrix.height - 2):
+            for i in range(-1, 2):
+                for j in range(-1, 2):
+                    matrix[x + i][y + j].bit = (i, j) != (0, 0)
+                    matrix[x + i][y + j].is_service_bit = True
+
+
+def sync_strips(matrix: Symbol, columns: list[int]) -> None:
+    """Adding sync bars along the upper and lower edges, the left and right
+    edges and through the alignment patterns.
+
+    Args:
+        matrix: Matrix containing qr code pixels.
+        columns: Columns of the alignment pattern centers.
+    """
+    for i in (0, matrix.height - 1):
+        for j in range(matrix.width):
+            if not matrix[i][j].is_service_bit:
+                matrix[i][j].bit = j % 2 == 0
+                matrix[i][j].is_service_bit = True
+
+    for j in [0, matrix.width - 1] + columns:
+        for i in range(matrix.height):
+            if not matrix[i][j].is_service_bit:
+                matrix[i][j].bit = i % 2 == 0
+                matrix[i][j].is_service_bit = True
+
+
+def format_code(matrix: Symbol, codes: tuple[str, str]) -> None:
+    """Adding the format information next to the search pattern and the
+    search sub-pattern.
+
+    Args:
+        matrix: Matrix containing qr code pixels.
+        codes: Left and right format codes (18 bits, the highest first).
+    """
+    left, right = codes
+    x = matrix.height - 6
+    y = matrix.width - 8
+
+    for pos_bit in range(18):
+        matrix[1 + pos_bit % 5][8 + pos_bit // 5].bit = int(left[17 - pos_bit])
+        matrix[1 + pos_bit % 5][8 + pos_bit // 5].is_service_bit = True
+
+        if pos_bit < 15:
+            point = matrix[x + pos_bit % 5][y + pos_bit // 5]
+        else:
+            point = matrix[x][y + pos_bit - 12]
+
+        point.bit = int(right[17 - pos_bit])
+        point.is_service_bit = True
+
+
+@lru_cache(maxsize=None)
+def template(version: int) -> Symbol:
+    """Matrix with all the service modules and a reserved area for the
+    format information, built once per version.
+
+    Args:
+        version: rMQR code version (1-32).
+
+    Returns:
+        Read-only rMQR Code Matrix.
+    """
+    size = rmqrTables.size_table().get(version)
+
+    if size is None:
+        raise Exception("Error! Incorrect version entered.")
+
+    height, width = size
+    columns = rmqrTables.alignment_patterns_table()[width]
+    matrix = Symbol(width, height=height)
+
+    search_patterns(matrix, 0, 0)
+    search_sub_pattern(matrix)
+    corner_patterns(matrix)
+    alignment_patterns(matrix, columns)
+    sync_strips(matrix, columns)
+    format_code(matrix, ("0" * 18, "0" * 18))
+
+    return matrix.freeze()
+
+
+@lru_cache(maxsize=None)
+def placement(version: int) -> tuple[int, ...]:
+    """Order of data modules: two-module wide columns from right to left,
+    alternately up and down, starting next to the right sync bar and
+    skipping service modules.
+
+    Args:
+        version: rMQR code version.
+
+    Returns:
+        Module indices in the order of placement.
+    """
+    matrix = template(version)
+
+    return zigzag(matrix.service, matrix.width, matrix.height, matrix.width - 1)
+
+
+@lru_cache(maxsize=None)
+def mask_layer(version: int) -> int:
+    """Mask restricted to the data modules.
+
+    Args:
+        version: rMQR code version.
+
+    Returns:
+        Packed matrix bits (see symbol.pack), a bit is set where the mask
+        inverts a data module.
+    """
+    matrix = template(version)
+    func_mask = tables.mask_table()[MASK]
+
+    layer = bytearray(len(matrix.bits))
+    for index in placement(version):
+        pos_i, pos_j = divmod(index, matrix.width)
+        layer[index] = func_mask(pos_i, pos_j) == 0
+
+    return pack(layer)
+
+
+@lru_cache(maxsize=None)
+def format_layer(version: int, correction_level: int) -> int:
+    """Format information of the version and correction level.
+
+    Args:
+        version: rMQR code version.
+        correction_level: Correction level.
+
+    Returns:
+        Packed matrix bits (see symbol.pack) of the code.
+    """
+    codes = rmqrTables.format_table().get((version, correction_level))
+
+    if codes is None:
+        raise Exception("Error! Incorrect correction level entered.")
+
+    height, width = rmqrTables.size_table()[version]
+    matrix = Symbol(width, height=height)
+    format_code(matrix, codes)
+
+    return pack(matrix.bits)
+
+
+def create(
+    comb_blocks: list[int],
+    version: int,
+    correction_level: int,
+    mask_strategy: int = const.MASK_FULL,
+    mask: int = None
+) -> Symbol:
+    """Generating an rMQR Code Matrix.
+
+    Args:
+        comb_blocks: Data blocks.
+        version: rMQR code version (1-32).
+        correction_level: Correction level (LEVEL_M or LEVEL_H).
+        mask_strategy: Only the default const.MASK_FULL is accepted, rMQR
+        codes have one mask.
+        mask: Only None is accepted.
+
+    Returns:
+        rMQR Code Matrix, its `mask` attribute is 0 (the only mask) and
+        `mask_strategy` const.MASK_FIXED.
+    """
+    if mask is not None or mask_strategy != const.MASK_FULL:
+        raise Exception("Error! rMQR codes have one mask, it can not be chosen.")
+
+    matrix = template(version).copy()
+    order = placement(version)
+    length = len(matrix.bits)
+
+    fill_data(matrix, order, data_bits(comb_blocks, len(order)))
+
+    unmasked = pack(matrix.bits)
+    code = format_layer(version, correction_level)
+
+    matrix.bits[:] = unpack((unmasked ^ mask_layer(version)) | code, length)
+
+    matrix.mask = 0
+    matrix.mask_strategy = const.MASK_FIXED
+
+    return matrix
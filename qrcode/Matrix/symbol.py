@@ -0,0 +1,227 @@
+from typing import Iterator, Optional, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from qrcode.Constants import const
+from qrcode.Point.point import PointView
+
+
+Buffer = Union[bytes, bytearray]
+
+# NumPy is used when it is installed
+BACKEND = const.BACKEND_PYTHON if numpy is None else const.BACKEND_NUMPY
+
+
+def get_backend(backend: Optional[int]) -> int:
+    """Checking the matrix backend.
+
+    Args:
+        backend: const.BACKEND_PYTHON, const.BACKEND_NUMPY or None (NumPy
+        when it is installed).
+
+    Returns:
+        Backend.
+    """
+    if backend is None:
+        return BACKEND
+
+    if backend == const.BACKEND_NUMPY and numpy is None:
+        raise Exception("Error! NumPy is not installed.")
+
+    return backend
+
+
+# 0 -> '0', 1 -> '1' and back
+_TO_ASCII = bytes.maketrans(b'\x00\x01', b'01')
+_FROM_ASCII = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def pack(buffer: Buffer) -> int:
+    """Packing a buffer of bits (one byte per bit) into a number, the first
+    bit of the buffer becomes the most significant bit.
+
+    Args:
+        buffer: Bits.
+
+    Returns:
+        Packed bits.
+    """
+    return int(buffer.translate(_TO_ASCII), 2)
+
+
+def unpack(value: int, length: int) -> bytes:
+    """Unpacking a number into a buffer of bits (one byte per bit).
+
+    Args:
+        value: Packed bits.
+        length: Number of bits.
+
+    Returns:
+        Bits.
+    """
+    return format(value, f'0{length}b').encode().translate(_FROM_ASCII)
+
+
+class Symbol:
+    def __init__(
+            self,
+            width: int,
+            bits: Buffer = None,
+            service: Buffer = None,
+            pattern: Buffer = None,
+            height: int = None
+    ) -> None:
+        """QR code matrix stored as flat buffers, one byte per module
+        (row by row).
+
+        Args:
+            width: Matrix width (the size of a square matrix).
+            bits: Bit values (1 or 0). Defaults to all 0.
+            service: Service module flags. Defaults to all 0.
+            pattern: Search pattern module flags. Defaults to all 0.
+            height: Matrix height. Defaults to the width.
+        """
+        self.width = width
+        self.height = width if height is None else height
+
+        length = self.width * self.height
+        self.bits = bytearray(length) if bits is None else bits
+        self.service = bytearray(length) if service is None else service
+        self.pattern = bytearray(length) if pattern is None else pattern
+
+        # mask number and the strategy it was chosen by (see matrix.create)
+        self.mask = None
+        self.mask_strategy = None
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, i: int) -> "SymbolRow":
+        if i < 0:
+            i += self.height
+        if not 0 <= i < self.height:
+            raise IndexError("symbol row index out of range")
+        return SymbolRow(self, i)
+
+    def __iter__(self) -> Iterator["SymbolRow"]:
+        for i in range(self.height):
+            yield SymbolRow(self, i)
+
+    @property
+    def size(self) -> int:
+        """Size of a square matrix (its width)."""
+        return self.width
+
+    @property
+    def modules(self) -> "numpy.ndarray":
+        """Module values as a (height, width) uint8 array sharing memory
+        with the symbol (NumPy backend)."""
+        return numpy.frombuffer(self.bits, dtype=numpy.uint8).reshape(self.height, self.width)
+
+    @property
+    def reserved(self) -> "numpy.ndarray":
+        """Service module mask as a (height, width) bool array sharing
+        memory with the symbol (NumPy backend)."""
+        return numpy.frombuffer(self.service, dtype=numpy.bool_).reshape(self.height, self.width)
+
+    @property
+    def patterns(self) -> "numpy.ndarray":
+        """Search pattern module mask as a (height, width) bool array
+        sharing memory with the symbol (NumPy backend)."""
+        return numpy.frombuffer(self.pattern, dtype=numpy.bool_).reshape(self.height, self.width)
+
+    def dark_modules(self, backend: int = None) -> Iterator[tuple[int, int, int]]:
+        """Dark modules column by column.
+
+        Args:
+            backend: const.BACKEND_PYTHON or const.BACKEND_NUMPY. Defaults
+            to NumPy when it is installed.
+
+        Returns:
+            Iterator of (column, row, is_pattern) tuples.
+        """
+        backend = get_backend(backend)
+
+        if backend == const.BACKEND_NUMPY:
+            columns, rows = numpy.nonzero(self.modules.T)
+            patterns = self.patterns[rows, columns]
+            return zip(columns.tolist(), rows.tolist(), patterns.tolist())
+
+        width = self.width
+        bits = self.bits
+        pattern = self.pattern
+
+        return (
+            (i, j, pattern[j * width + i])
+            for i in range(width)
+            for j in range(self.height)
+            if bits[j * width + i]
+        )
+
+    def copy(self) -> "Symbol":
+        """Writable copy of the symbol.
+
+        Returns:
+            New symbol with copied buffers.
+        """
+        result = Symbol(
+            self.width,
+            bytearray(self.bits),
+            bytearray(self.service),
+            bytearray(self.pattern),
+            self.height
+        )
+        result.mask = self.mask
+        result.mask_strategy = self.mask_strategy
+
+        return result
+
+    def freeze(self) -> "Symbol":
+        """Read-only copy of the symbol.
+
+        Returns:
+            New symbol with immutable buffers.
+        """
+        result = Symbol(
+            self.width,
+            bytes(self.bits),
+            bytes(self.service),
+            bytes(self.pattern),
+            self.height
+        )
+        result.mask = self.mask
+        result.mask_strategy = self.mask_strategy
+
+        return result
+
+
+class SymbolRow:
+    __slots__ = ("_symbol", "_offset")
+
+    def __init__(self, symbol: Symbol, i: int) -> None:
+        """Row of a symbol giving Point-style access to its modules.
+
+        Args:
+            symbol: Symbol.
+            i: Row number.
+        """
+        self._symbol = symbol
+        self._offset = i * symbol.width
+
+    def __len__(self) -> int:
+        return self._symbol.width
+
+    def __getitem__(self, j: int) -> PointView:
+        width = self._symbol.width
+        if j < 0:
+            j += width
+        if not 0 <= j < width:
+            raise IndexError("symbol column index out of range")
+        return PointView(self._symbol, self._offset + j)
+
+    def __iter__(self) -> Iterator[PointView]:
+        for j in range(self._symbol.width):
+            yield PointView(self._symbol, self._offset + j)
@@ -1,13 +1,21 @@
-from qrcode.Point.point import Point
+from functools import lru_cache
+from typing import Callable, NamedTuple, Sequence
 
+from qrcode.Constants import const
+from qrcode.Matrix import symbol
+from qrcode.Matrix.symbol import Symbol, pack
 
-def first_rule(matrix: list[list[Point]]) -> int:
+# 'BWBBBWB' with 4 white modules on one side, as 11-bit numbers
+FINDER_LIKE = (0b10111010000, 0b00001011101)
+
+
+def first_rule(matrix: list[Sequence[int]]) -> int:
     """Rule 1. Horizontally and vertically, for every 5 or more consecutive
     modules of the same color, a number of points is awarded equal to the
     length of this section minus 2.
 
     Args:
-        matrix (list[list[Point]]): Filled QR code matrix.
+        matrix (list[Sequence[int]]): Rows of the filled QR code matrix.
 
     Returns:
         int: Number of points.
@@ -15,7 +23,7 @@ def first_rule(matrix: list[list[Point]]) -> int:
     size = len(matrix)
     score = 0
     for i in range(size):
-        if matrix[i][0].bit == 1:
+        if matrix[i][0] == 1:
             flag = True
         else:
             flag = False
@@ -23,7 +31,7 @@ def first_rule(matrix: list[list[Point]]) -> int:
 
         for j in range(1, size):
             if flag:
-                if matrix[i][j].bit == 1:
+                if matrix[i][j] == 1:
                     count += 1
                 else:
                     if count >= 5:
@@ -32,7 +40,7 @@ def first_rule(matrix: list[list[Point]]) -> int:
                     count = 1
 
             else:
-                if matrix[i][j].bit == 0:
+                if matrix[i][j] == 0:
                     count += 1
 
                 else:
@@ -47,12 +55,12 @@ def first_rule(matrix: list[list[Point]]) -> int:
     return score
 
 
-def second_rule(matrix: list[list[Point]]) -> int:
+def second_rule(matrix: list[Sequence[int]]) -> int:
     """Rule 2. For each 2 by 2 square of modules of the same color,
     3 points are awarded.
 
     Args:
-        matrix (list[list[Point]]): Filled QR code matrix.
+        matrix (list[Sequence[int]]): Rows of the filled QR code matrix.
 
     Returns:
         int: Number of points.
@@ -62,10 +70,10 @@ def second_rule(matrix: list[list[Point]]) -> int:
 
     for i in range(size - 1):
         for j in range(size - 1):
-            a = matrix[i][j].bit
-            b = matrix[i][j + 1].bit
-            c = matrix[i + 1][j].bit
-            d = matrix[i + 1][j + 1].bit
+            a = matrix[i][j]
+            b = matrix[i][j + 1]
+            c = matrix[i + 1][j]
+            d = matrix[i + 1][j + 1]
 
             if a == b == c == d:
                 score += 3
@@ -73,12 +81,12 @@ def second_rule(matrix: list[list[Point]]) -> int:
     return score
 
 
-def third_rule(matrix: list[list[Point]]) -> int:
+def third_rule(matrix: list[Sequence[int]]) -> int:
     """Rule 3. For each sequence of 'BWBBBWB' modules, with 4 white modules
     on one side, 40 points are added.
 
     Args:
-        matrix (list[list[Point]]): Filled QR code matrix.
+        matrix (list[Sequence[int]]): Rows of the filled QR code matrix.
 
     Returns:
         int: Number of points.
@@ -91,10 +99,8 @@ def third_rule(matrix: list[list[Point]]) -> int:
     length = 11
 
     for i in range(size):
-        string = ""
         # * to str
-        for j in range(size):
-            string += str(matrix[i][j].bit)
+        string = ''.join(map(str, matrix[i]))
 
         pos = 0
         while pos + length <= len(string):
@@ -106,19 +112,19 @@ def third_rule(matrix: list[list[Point]]) -> int:
     return score
 
 
-def fourth_rule(matrix: list[list[Point]]) -> int:
+def fourth_rule(matrix: list[Sequence[int]]) -> int:
     """Rule 4. The number of points at this step depends on the ratio
     of the number of black and white modules.
 
     Args:
-        matrix (list[list[Point]]): Filled QR code matrix.
+        matrix (list[Sequence[int]]): Rows of the filled QR code matrix.
 
     Returns:
         int: Number of points.
     """
     size = len(matrix)
 
-    black = sum(matrix[i][j].bit for i in range(size) for j in range(size))
+    black = sum(matrix[i][j] for i in range(size) for j in range(size))
     black_per = abs(black/size**2 * 100 - 50)
 
     score = int(black_per) * 2
@@ -126,33 +132,266 @@ def fourth_rule(matrix: list[list[Point]]) -> int:
     return score
 
 
-def make(matrix: list[list[Point]]) -> int:
+def make(matrix: Symbol, backend: int = None) -> int:
     """Mask testing.
 
     Args:
-        matrix (list[list[Point]]): Filled QR code matrix.
+        matrix (Symbol): Filled QR code matrix.
+        backend (int, optional): const.BACKEND_PYTHON or
+        const.BACKEND_NUMPY. Defaults to NumPy when it is installed.
 
     Returns:
         int: Total points
     """
+    backend = symbol.get_backend(backend)
+
+    if backend == const.BACKEND_NUMPY:
+        modules = matrix.modules
+        rows = modules.tolist()
+        # * transpose matrix
+        columns = modules.T.tolist()
+
+    else:
+        size = matrix.size
+        bits = matrix.bits
+
+        rows = [bits[i * size:(i + 1) * size] for i in range(size)]
+        # * transpose matrix
+        columns = [bits[j::size] for j in range(size)]
+
+    score = 0
+
+    score += first_rule(rows)
+    score += first_rule(columns)
+
+    score += second_rule(rows)
+
+    score += third_rule(rows)
+    score += third_rule(columns)
+
+    score += fourth_rule(rows)
+    return score
+
+
+class BitsetMasks(NamedTuple):
+    """Precomputed masks of packed matrices (see symbol.pack) of one size.
+
+    Attributes:
+        left: Modules that have a left neighbour.
+        up: Modules that have an upper neighbour.
+        row_end: Modules that end a horizontal window of 11 modules.
+        column_end: Modules that end a vertical window of 11 modules.
+    """
+    left: int
+    up: int
+    row_end: int
+    column_end: int
+
+
+@lru_cache(maxsize=None)
+def bitset_masks(size: int) -> BitsetMasks:
+    """Masks for the bitset engine (cached).
+
+    Args:
+        size (int): Matrix size.
+
+    Returns:
+        BitsetMasks: Masks of packed matrices.
+    """
+    def mask(condition) -> int:
+        return pack(bytes(
+            condition(i, j) for i in range(size) for j in range(size)
+        ))
+
+    return BitsetMasks(
+        left=mask(lambda i, j: j >= 1),
+        up=mask(lambda i, j: i >= 1),
+        row_end=mask(lambda i, j: j >= 10),
+        column_end=mask(lambda i, j: i >= 10)
+    )
+
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:
+    # Python < 3.10
+    def _popcount(value: int) -> int:
+        return bin(value).count('1')
+
+
+def _equal(value: int, shift: int, valid: int) -> int:
+    # modules equal to the module `shift` positions before them
+    return ~(value ^ (value >> shift)) & valid
+
+
+def first_rule_bitset(value: int, size: int) -> int:
+    """Rule 1 for a packed matrix, rows and columns (bitset engine).
+
+    Args:
+        value (int): Packed matrix (see symbol.pack).
+        size (int): Matrix size.
+
+    Returns:
+        int: Number of points.
+    """
+    masks = bitset_masks(size)
+    score = 0
+
+    for shift, valid in ((1, masks.left), (size, masks.up)):
+        equal = _equal(value, shift, valid)
+
+        # ends of 5 modules of the same color, the first end of a run adds
+        # the remaining 2 points
+        runs = equal & (equal >> shift) & (equal >> 2 * shift) & (equal >> 3 * shift)
+        starts = runs & ~(runs >> shift)
+
+        score += _popcount(runs) + 2 * _popcount(starts)
+
+    return score
+
+
+def second_rule_bitset(value: int, size: int) -> int:
+    """Rule 2 for a packed matrix (bitset engine).
+
+    Args:
+        value (int): Packed matrix (see symbol.pack).
+        size (int): Matrix size.
+
+    Returns:
+        int: Number of points.
+    """
+    masks = bitset_masks(size)
+
+    horizontal = _equal(value, 1, masks.left)
+    vertical = _equal(value, size, masks.up)
+
+    # 2 by 2 squares by their lower right module
+    squares = horizontal & vertical & (horizontal >> size)
+
+    return 3 * _popcount(squares)
 
-    # * transpose matrix
-    matrix_t = []
-    for j in range(len(matrix)):
-        block = []
-        for i in range(len(matrix)):
-            block.append(matrix[i][j])
-        matrix_t.append(block)
 
+def third_rule_bitset(value: int, size: int) -> int:
+    """Rule 3 for a packed matrix, rows and columns (bitset engine).
+
+    Args:
+        value (int): Packed matrix (see symbol.pack).
+        size (int): Matrix size.
+
+    Returns:
+        int: Number of points.
+    """
+    masks = bitset_masks(size)
+    length = 11
     score = 0
 
-    score += first_rule(matrix)
-    score += first_rule(matrix_t)
+    for step, valid in ((1, masks.row_end), (size, masks.column_end)):
+        shifted = [value >> (step * (length - 1 - k)) for k in range(length)]
 
-    score += second_rule(matrix)
+        for sequence in FINDER_LIKE:
+            found = valid
+            for k in range(length):
+                if sequence >> (length - 1 - k) & 1:
+                    found &= shifted[k]
+                else:
+                    found &= ~shifted[k]
 
-    score += third_rule(matrix)
-    score += third_rule(matrix_t)
+            score += 40 * _popcount(found)
 
-    score += fourth_rule(matrix)
     return score
+
+
+def fourth_rule_bitset(value: int, size: int) -> int:
+    """Rule 4 for a packed matrix (bitset engine).
+
+    Args:
+        value (int): Packed matrix (see symbol.pack).
+        size (int): Matrix size.
+
+    Returns:
+        int: Number of points.
+    """
+    black_per = abs(_popcount(value)/size**2 * 100 - 50)
+
+    return int(black_per) * 2
+
+
+def make_bitset(value: int, size: int) -> int:
+    """Mask testing of a packed matrix, without NumPy.
+
+    Args:
+        value (int): Packed matrix (see symbol.pack).
+        size (int): Matrix size.
+
+    Returns:
+        int: Total points
+    """
+    return (first_rule_bitset(value, size)
+            + second_rule_bitset(value, size)
+            + third_rule_bitset(value, size)
+            + fourth_rule_bitset(value, size))
+
+
+def select_mask(
+    initial: Sequence[int],
+    rules: Sequence[Callable[[int], int]]
+) -> tuple[int, int]:
+    """Choosing the mask with the lowest total points (branch and bound).
+
+    Candidates are tested in the order of their initial points, the rules
+    are added one by one and a candidate is abandoned as soon as its partial
+    points exceed the best total so far. Of several masks with the lowest
+    total the one with the lowest number is chosen.
+
+    Args:
+        initial (Sequence[int]): Points of the cheap rules of every
+        candidate, indexed by mask number.
+        rules (Sequence[Callable[[int], int]]): Remaining rules in order
+        of cost, each takes a mask number and returns its points.
+
+    Returns:
+        tuple[int, int]: Mask number and its total points.
+    """
+    best = None
+
+    for num in sorted(range(len(initial)), key=lambda n: (initial[n], n)):
+        score = initial[num]
+
+        for rule in rules:
+            if best is not None and (score, num) > best:
+                break
+            score += rule(num)
+
+        else:
+            if best is None or (score, num) < best:
+                best = (score, num)
+
+    return best[1], best[0]
+
+
+def select_mask_bitset(
+    candidates: Sequence[int],
+    size: int,
+    fast: bool = False
+) -> tuple[int, int]:
+    """Choosing the mask of packed matrices (bitset engine).
+
+    Args:
+        candidates (Sequence[int]): Packed matrices by mask number.
+        size (int): Matrix size.
+        fast (bool, optional): Only the cheap rules 2 and 4 are scored.
+        Defaults to False.
+
+    Returns:
+        tuple[int, int]: Mask number and its (partial if fast) points.
+    """
+    rules = [
+        lambda num: second_rule_bitset(candidates[num], size),
+        lambda num: first_rule_bitset(candidates[num], size),
+        lambda num: third_rule_bitset(candidates[num], size)
+    ]
+
+    return select_mask(
+        [fourth_rule_bitset(candidate, size) for candidate in candidates],
+        rules[:1] if fast else rules
+    )
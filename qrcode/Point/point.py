@@ -14,3 +14,41 @@ class Point:
         self.bit = bit
         self.is_service_bit = is_service_bit
         self.is_pattern = is_pattern
+
+
+class PointView:
+    __slots__ = ("_symbol", "_index")
+
+    def __init__(self, symbol, index: int) -> None:
+        """Point-compatible access to a single module of a symbol.
+
+        Args:
+            symbol: Symbol (qrcode.Matrix.symbol.Symbol) containing the module.
+            index: Module index in the flat buffers of the symbol.
+        """
+        self._symbol = symbol
+        self._index = index
+
+    @property
+    def bit(self) -> int:
+        return self._symbol.bits[self._index]
+
+    @bit.setter
+    def bit(self, value: int) -> None:
+        self._symbol.bits[self._index] = value
+
+    @property
+    def is_service_bit(self) -> int:
+        return self._symbol.service[self._index]
+
+    @is_service_bit.setter
+    def is_service_bit(self, value: int) -> None:
+        self._symbol.service[self._index] = value
+
+    @property
+    def is_pattern(self) -> int:
+        return self._symbol.pattern[self._index]
+
+    @is_pattern.setter
+    def is_pattern(self, value: int) -> None:
+        self._symbol.pattern[self._index] = value
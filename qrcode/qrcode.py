@@ -1,8 +1,11 @@
+import copy
+from typing import Union
+
 from PIL import Image
 
-from qrcode.Matrix import matrix
+from qrcode.Matrix import matrix, micro as micro_matrix, rmqr as rmqr_matrix
 from qrcode.Constants import const
-from qrcode.Coding import encode
+from qrcode.Coding import encode, micro, rmqr
 from qrcode.Draw import qrDraw
 
 
@@ -12,7 +15,13 @@ class QRCode:
         border=4,
         step=8,
         encoding_type=const.TYPE_BYTE,
-        correction_level=const.LEVEL_M
+        correction_level=const.LEVEL_M,
+        backend=None,
+        mask_strategy=const.MASK_FULL,
+        mask=None,
+        charset=None,
+        symbol_type=const.SYMBOL_QR,
+        rmqr_height=None
     ) -> None:
         """Class constructor
 
@@ -30,6 +39,11 @@ class QRCode:
 
                 const.TYPE_DIGIT == Digital coding
 
+                const.TYPE_KANJI == Kanji coding (Shift JIS)
+
+                const.TYPE_AUTO == Segments of the four codings with the
+                minimum total length
+
             correction_level ([type], optional): Defaults to const.LEVEL_M.
             Correction level:
                 const.LEVEL_L == maximum 7% damage allowed
@@ -39,18 +53,70 @@ class QRCode:
                 const.LEVEL_Q == maximum 25% damage allowed
 
                 const.LEVEL_H == maximum 30% damage allowed
+
+            backend ([type], optional): Defaults to None (NumPy when it is
+            installed, otherwise pure Python).
+            Matrix backend:
+                const.BACKEND_PYTHON == Pure Python
+
+                const.BACKEND_NUMPY == NumPy arrays
+
+            mask_strategy ([type], optional): Defaults to const.MASK_FULL.
+            Mask selection:
+                const.MASK_FULL == all four penalty rules (ISO/IEC 18004)
+
+                const.MASK_FAST == only the cheap rules 2 and 4
+
+                const.MASK_FIXED == the mask given by `mask`
+
+            mask (int, optional): Mask number (0-7, 0-3 for Micro QR; rMQR
+            codes have one mask and accept neither a mask nor another
+            strategy), implies const.MASK_FIXED. Defaults to
+            None. The mask used and the strategy it was chosen by are
+            stored in self.matrix.mask and self.matrix.mask_strategy.
+
+            charset (str, optional): Character set of byte coding, added
+            to the code as an ECI segment. Defaults to None (UTF-8 without
+            ECI).
+            Character set:
+                A codec name, for example "iso-8859-1" or "cp1251"
+
+                "auto" == the most compact of the common character sets
+
+            symbol_type ([type], optional): Defaults to const.SYMBOL_QR.
+            Symbol type:
+                const.SYMBOL_QR == QR code
+
+                const.SYMBOL_MICRO == Micro QR code (M1-M4, one search
+                pattern, levels L, M and Q, no charset) when the data fits,
+                otherwise QR code. self.micro tells which one was made.
+
+                const.SYMBOL_RMQR == rectangular Micro QR code (rMQR, 32
+                sizes from R7x43 to R17x139, levels M and H, no charset),
+                the smallest one that fits the data
+
+            rmqr_height (int, optional): The largest height of an rMQR code
+            (7-17 modules). Defaults to None (any).
         """
 
         self.border = border
         self.step = step
         self.correction_level = correction_level
         self.encoding_type = encoding_type
+        self.backend = backend
+        self.mask_strategy = mask_strategy
+        self.mask = mask
+        self.charset = charset
+        self.symbol_type = symbol_type
+        self.rmqr_height = rmqr_height
 
         self.data = ""
         self.version = 0
+        self.micro = False
         self.combined_block = []
         self.matrix = []
         self.size_matrix = 0
+        self.height_matrix = 0
         self.img = Image.new('RGBA', (1, 1), "#6A5ACD")
 
         # check
@@ -65,11 +131,12 @@ class QRCode:
         else:
             raise Exception("Error! Incorrect correction level entered.")
 
-    def add_data(self, data: str) -> None:
+    def add_data(self, data: Union[str, bytes, bytearray, memoryview]) -> None:
         """Method for adding data to encoding.
 
         Args:
-            data (str): The string to be encoded.
+            data (Union[str, bytes, bytearray, memoryview]): The string to be
+            encoded, binary data is encoded with byte coding.
         """
         self.data = data
 
@@ -82,23 +149,120 @@ class QRCode:
             radius: int = None
     ) -> None:
         """Method performing QR code generation."""
-        self.combined_block, self.version = encode.encode(
+        result = None
+
+        if self.symbol_type == const.SYMBOL_RMQR:
+            result = rmqr.encode(
+                self.data,
+                self.encoding_type,
+                self.correction_level,
+                self.charset,
+                self.rmqr_height
+            )
+
+        elif self.symbol_type == const.SYMBOL_MICRO:
+            result = micro.encode(
+                self.data,
+                self.encoding_type,
+                self.correction_level,
+                self.charset
+            )
+
+        self.micro = result is not None and self.symbol_type == const.SYMBOL_MICRO
+
+        if result is None:
+            result = encode.encode(
+                self.data,
+                self.encoding_type,
+                self.correction_level,
+                self.charset
+            )
+
+        self.combined_block, self.version = result
+
+        self._draw(pixel_type, pixel_color, bg_color, with_outline, radius)
+
+    def make_structured(
+            self,
+            max_version: int = 40,
+            pixel_type: str = "rectangle",
+            pixel_color: str = "black",
+            bg_color: str = "white",
+            with_outline: bool = True,
+            radius: int = None
+    ) -> list["QRCode"]:
+        """Method performing generation of a Structured Append sequence:
+        data that does not fit into one QR code of max_version is split
+        into up to 16 QR codes.
+
+        Args:
+            max_version (int, optional): The largest version of the QR
+            codes. Defaults to 40.
+
+        Returns:
+            list[QRCode]: QR codes in the order of the sequence, the other
+            arguments are the same as in make().
+        """
+        parts = encode.encode_structured(
             self.data,
             self.encoding_type,
-            self.correction_level
+            self.correction_level,
+            self.charset,
+            max_version,
+            self.backend
         )
 
-        self.matrix = matrix.create(
-            self.combined_block,
-            self.version,
-            self.correction_level
-        )
-        self.size_matrix = len(self.matrix)
+        result = []
+        for combined_block, version in parts:
+            qr = copy.copy(self)
+            qr.combined_block, qr.version = combined_block, version
+            qr.micro = False
+            qr.symbol_type = const.SYMBOL_QR
+            qr._draw(pixel_type, pixel_color, bg_color, with_outline, radius)
+            result.append(qr)
+
+        return result
+
+    def _draw(
+            self,
+            pixel_type: str,
+            pixel_color: str,
+            bg_color: str,
+            with_outline: bool,
+            radius: int
+    ) -> None:
+        if self.symbol_type == const.SYMBOL_RMQR:
+            self.matrix = rmqr_matrix.create(
+                self.combined_block,
+                self.version,
+                self.correction_level,
+                self.mask_strategy,
+                self.mask
+            )
+        elif self.micro:
+            self.matrix = micro_matrix.create(
+                self.combined_block,
+                self.version,
+                self.correction_level,
+                self.mask_strategy,
+                self.mask
+            )
+        else:
+            self.matrix = matrix.create(
+                self.combined_block,
+                self.version,
+                self.correction_level,
+                self.backend,
+                self.mask_strategy,
+                self.mask
+            )
+        self.size_matrix = self.matrix.width
+        self.height_matrix = self.matrix.height
 
         self.img = Image.new(
             'RGBA',
             ((self.size_matrix + 2 * self.border) * self.step,
-             (self.size_matrix + 2 * self.border) * self.step),
+             (self.height_matrix + 2 * self.border) * self.step),
             bg_color
         )
 
@@ -177,7 +341,7 @@ class QRCode:
         """
         img = Image.open(name).convert("RGBA")
 
-        area = int(self.size_matrix ** 2 * self.level_coff)
+        area = int(self.size_matrix * self.height_matrix * self.level_coff)
         side = int(area**0.5)
 
         w_scale = img.width / img.height
@@ -202,6 +366,6 @@ class QRCode:
             bg.paste(img, mask=img.split()[3])
 
         pos_i = self.border * self.step + self.size_matrix * self.step // 2 - width // 2
-        pos_j = self.border * self.step + self.size_matrix * self.step // 2 - height // 2
+        pos_j = self.border * self.step + self.height_matrix * self.step // 2 - height // 2
 
         self.img.paste(bg, (pos_i, pos_j), bg.split()[3])
@@ -0,0 +1,167 @@
+"""
+This module contains a template for runs of strings that differ in a few
+characters (serial numbers). Reed-Solomon correction bytes and masking are
+linear, so a variant is produced from the template by XORing only the
+contribution of the changed data bytes.
+"""
+from functools import lru_cache
+from typing import Optional
+
+import qrcode.Coding.methods as mt
+from qrcode.Coding import encode, reed_solomon
+from qrcode.Coding.methods import Data
+from qrcode.Constants import const, spec
+from qrcode.Matrix import matrix
+from qrcode.Matrix.symbol import Symbol
+
+
+@lru_cache(maxsize=None)
+def parity(block_size: int, degree: int, pos: int, value: int) -> int:
+    """Correction bytes of a block with the only nonzero byte.
+
+    Args:
+        block_size: Number of data bytes in the block.
+        degree: Number of correction bytes.
+        pos: Position of the byte in the block.
+        value: Byte.
+
+    Returns:
+        Packed correction bytes (the first byte is the most significant).
+    """
+    data = bytearray(block_size - pos)
+    data[0] = value
+
+    return int.from_bytes(reed_solomon.remainder(data, degree), 'big')
+
+
+class SerialTemplate:
+    def __init__(
+        self,
+        template: Data,
+        encoding_type: int,
+        correction_level: int,
+        mask_strategy: int = const.MASK_FULL,
+        mask: int = None,
+        charset: Optional[str] = None
+    ) -> None:
+        """Encoded and placed template string. Variants must fit into the same
+        version (for example a fixed-width serial number) and use the mask
+        chosen for the template.
+
+        Args:
+            template: Template string.
+            encoding_type: Encoding type. (TYPE_BYTE, TYPE_ALPHA, TYPE_DIGIT, TYPE_KANJI or TYPE_AUTO)
+            correction_level: Correction level. (LEVEL_L, LEVEL_M, LEVEL_Q or LEVEL_H)
+            mask_strategy: Mask selection for the template (see matrix.create).
+            mask: Mask number (0-7), implies const.MASK_FIXED.
+            charset: Character set of byte coding (see encode.encode), "auto"
+            is resolved for the template.
+        """
+        self.encoding_type = encoding_type
+        self.correction_level = correction_level
+        self.charset = mt.charset_name(template, charset)
+
+        self.combined_block, self.version = encode.encode(
+            template, encoding_type, correction_level, self.charset
+        )
+        self.matrix = matrix.create(
+            self.combined_block,
+            self.version,
+            correction_level,
+            mask_strategy=mask_strategy,
+            mask=mask
+        ).freeze()
+
+        symbol_spec = spec.get(self.version, correction_level)
+        self.data = self._data_codewords(template)
+
+        # block number and position in the block of every data byte
+        self.blocks = [
+            (num, pos)
+            for num, block_size in enumerate(symbol_spec.block_sizes)
+            for pos in range(block_size)
+        ]
+
+        # position in the combined block of every data and correction byte
+        self.positions = [0] * len(symbol_spec.interleave)
+        for i, index in enumerate(symbol_spec.interleave):
+            self.positions[index] = i
+
+        # modules of the combined block in the order of its bits
+        self.order = matrix.placement(self.version)
+
+    def _data_codewords(self, string: Data) -> bytes:
+        version, buffer = encode.data_stream(
+            string, self.encoding_type, self.correction_level, self.charset
+        )
+
+        if version != self.version:
+            raise Exception("Error! The string does not match the template.")
+
+        return buffer.to_bytes()
+
+    def _delta(self, string: Data) -> dict[int, int]:
+        # changed bytes of the combined block: {position: XOR of the bytes}
+        symbol_spec = spec.get(self.version, self.correction_level)
+        block_sizes = symbol_spec.block_sizes
+        degree = symbol_spec.ec_codewords
+        data_amount = len(self.data)
+
+        delta = {}
+        for index, (old, new) in enumerate(zip(self.data, self._data_codewords(string))):
+            if old == new:
+                continue
+
+            num, pos = self.blocks[index]
+            delta[self.positions[index]] = old ^ new
+
+            corr = parity(block_sizes[num], degree, pos, old ^ new)
+            for i, byte in enumerate(corr.to_bytes(degree, 'big')):
+                if byte:
+                    position = self.positions[data_amount + num * degree + i]
+                    delta[position] = delta.get(position, 0) ^ byte
+
+        return delta
+
+    def encode(self, string: Data) -> tuple[list[int], int]:
+        """Encoding a variant of the template.
+
+        Args:
+            string: The string to encode.
+
+        Returns:
+            Combined block and version of qrcode.
+        """
+        combined_block = list(self.combined_block)
+
+        for position, byte in self._delta(string).items():
+            combined_block[position] ^= byte
+
+        return combined_block, self.version
+
+    def create(self, string: Data) -> Symbol:
+        """Generating the QR Code Matrix of a variant of the template.
+
+        Args:
+            string: The string to encode.
+
+        Returns:
+            QR Code Matrix with the mask of the template.
+        """
+        bits = bytearray(self.matrix.bits)
+
+        for position, byte in self._delta(string).items():
+            for bit in range(8):
+                if byte & (0x80 >> bit):
+                    bits[self.order[8 * position + bit]] ^= 1
+
+        result = Symbol(
+            self.matrix.size,
+            bits,
+            self.matrix.service,
+            self.matrix.pattern
+        )
+        result.mask = self.matrix.mask
+        result.mask_strategy = self.matrix.mask_strategy
+
+        return result